@@ -0,0 +1,104 @@
+"""
+Throughput of one shared Client from 1 to N threads.
+
+Starts a mock Bitget server in a separate process and sends GETs
+through a single Client instance from an increasing number of threads.
+Run it on a regular and a free-threaded (python3.13t) build to compare:
+
+    python benchmarks/thread_scaling.py --threads 1 2 4 8 16 32 64
+"""
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, __file__.rsplit("/benchmarks/", 1)[0])
+
+from bitget_api_python import Client  # noqa: E402
+
+BODY = json.dumps({
+    "code": "00000",
+    "msg": "success",
+    "requestTime": 0,
+    "data": [{"symbol": "BTCUSDT", "lastPr": "65000.1"}],
+}).encode()
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    delay = 0.0
+
+    def do_GET(self) -> None:
+        if self.delay:
+            time.sleep(self.delay)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def serve(delay: float, ready) -> None:
+    MockHandler.delay = delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockHandler)
+    server.daemon_threads = True
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+def run(client, threads: int, seconds: float) -> float:
+    stop = time.monotonic() + seconds
+    counts = [0] * threads
+
+    def worker(i: int) -> None:
+        while time.monotonic() < stop:
+            client.get_ticker_info("BTCUSDT")
+            counts[i] += 1
+
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(worker, range(threads)))
+    return sum(counts) / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--threads", type=int, nargs="+",
+                        default=[1, 2, 4, 8, 16, 32, 64])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--delay", type=float, default=0.005,
+                        help="server latency per request in seconds")
+    args = parser.parse_args()
+
+    ready = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=serve, args=(args.delay, ready), daemon=True
+    )
+    server.start()
+    port = ready.get(timeout=10)
+
+    client = Client("key", "secret", "passphrase", check_connection=False)
+    client.HOST = f"http://127.0.0.1:{port}"
+    run(client, 1, 0.2)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL "
+          f"{'enabled' if gil else 'disabled'}, "
+          f"server delay {args.delay * 1000:g} ms")
+    print(f"{'threads':>8} {'req/s':>10} {'speedup':>8}")
+    base = None
+    for threads in args.threads:
+        rate = run(client, threads, args.seconds)
+        base = base or rate
+        print(f"{threads:>8} {rate:>10.0f} {rate / base:>7.2f}x")
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,15 @@
 from .bitget_auth import BitgetAuth
 from .bitget_client import Client
+from .streaming import iter_data
+from .rate_limit import RateLimiter
+from .exceptions import BitgetAPIError, CircuitOpenError, DeadlineExceeded
+from .export import BillsExporter
+from .ledger import Ledger
+from .pool import ClientPool
+from .tape import TradeTape
+from .scheduler import PriorityScheduler
+from .quantizer import QuantizerTable
+from .valuation import PortfolioValuer
+from .cache import ResponseCache
+from .polling import AdaptivePoller
+from .circuit import CircuitBreakers
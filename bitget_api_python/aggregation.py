@@ -0,0 +1,222 @@
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Sequence
+"""
+Local candle resampling and trade aggregation
+
+Candles use the layout returned by the candle endpoints:
+    [ts, open, high, low, close, baseVolume, usdtVolume, quoteVolume]
+with ts as int (Unix ms, bar open time) and the other fields as float.
+"""
+
+MINUTE_MS = 60 * 1000
+HOUR_MS = 60 * MINUTE_MS
+DAY_MS = 24 * HOUR_MS
+WEEK_MS = 7 * DAY_MS
+
+# Bars of 6h and longer without the "utc" suffix open at UTC+8
+# midnight, the others at UTC midnight.
+_UTC8 = -8 * HOUR_MS
+# 1970-01-05, the first Monday after the epoch
+_MONDAY = 4 * DAY_MS
+
+# granularity -> (period ms, bucket anchor ms)
+GRANULARITIES = {
+    "1min": (MINUTE_MS, 0),
+    "3min": (3 * MINUTE_MS, 0),
+    "5min": (5 * MINUTE_MS, 0),
+    "15min": (15 * MINUTE_MS, 0),
+    "30min": (30 * MINUTE_MS, 0),
+    "1h": (HOUR_MS, 0),
+    "4h": (4 * HOUR_MS, 0),
+    "6h": (6 * HOUR_MS, _UTC8),
+    "12h": (12 * HOUR_MS, _UTC8),
+    "1day": (DAY_MS, _UTC8),
+    "3day": (3 * DAY_MS, _UTC8),
+    "1week": (WEEK_MS, _MONDAY + _UTC8),
+    "6Hutc": (6 * HOUR_MS, 0),
+    "12Hutc": (12 * HOUR_MS, 0),
+    "1Dutc": (DAY_MS, 0),
+    "3Dutc": (3 * DAY_MS, 0),
+    "1Wutc": (WEEK_MS, _MONDAY),
+}
+# calendar months -> offset from UTC in ms
+MONTHS = {
+    "1M": 8 * HOUR_MS,
+    "1Mutc": 0,
+}
+
+
+def _granularity(granularity: str) -> tuple:
+    try:
+        return GRANULARITIES[granularity]
+    except KeyError:
+        raise ValueError(f"unknown granularity: {granularity}") from None
+
+
+def bucket_start(ts: int, granularity: str) -> int:
+    """
+    Returns the open time of the bar that contains ts.
+
+    Args:
+    - ts (int): Unix timestamp in milliseconds.
+    - granularity (str): Bar granularity, e.g. "15min", "1day", "1M".
+
+    Returns:
+    - int: Bar open time (Unix ms).
+    """
+    if granularity in MONTHS:
+        offset = MONTHS[granularity]
+        local = datetime.fromtimestamp((ts + offset) / 1000, timezone.utc)
+        start = local.replace(
+            day=1, hour=0, minute=0, second=0, microsecond=0
+        )
+        return int(start.timestamp() * 1000) - offset
+    period, anchor = _granularity(granularity)
+    return ts - (ts - anchor) % period
+
+
+def _bucket_end(start: int, granularity: str) -> int:
+    if granularity in MONTHS:
+        offset = MONTHS[granularity]
+        local = datetime.fromtimestamp((start + offset) / 1000, timezone.utc)
+        if local.month == 12:
+            local = local.replace(year=local.year + 1, month=1)
+        else:
+            local = local.replace(month=local.month + 1)
+        return int(local.timestamp() * 1000) - offset
+    return start + GRANULARITIES[granularity][0]
+
+
+def _check_divides(source: str, target: str) -> None:
+    if source in MONTHS:
+        raise ValueError("cannot resample from monthly bars")
+    period, source_anchor = _granularity(source)
+    if target in MONTHS:
+        # month boundaries fall on local midnight
+        if DAY_MS % period or (-MONTHS[target] - source_anchor) % period:
+            raise ValueError(f"{target} bars cannot be built from {source}")
+        return
+    target_period, target_anchor = _granularity(target)
+    if (target_period % period
+            or (target_anchor - source_anchor) % period):
+        raise ValueError(f"{target} bars cannot be built from {source}")
+
+
+def resample_candles(
+    candles: Iterable[Sequence],
+    source: str,
+    target: str,
+    complete_only: bool = False
+) -> List[list]:
+    """
+    Builds coarser candles from finer ones.
+
+    Args:
+    - candles (Iterable): Candles of the source granularity, in the
+        endpoint layout (strings or numbers, any order).
+    - source (str): Granularity of the input, e.g. "1min".
+    - target (str): Granularity to build, e.g. "1h".
+    - complete_only (bool, optional): Drop bars with missing source
+        candles (e.g. the current, still open bar). Defaults to False.
+
+    Returns:
+    - list: Candles of the target granularity, oldest first.
+    """
+    _check_divides(source, target)
+    period = GRANULARITIES[source][0]
+    rows = sorted(
+        ([int(c[0])] + [float(v) for v in c[1:8]] for c in candles),
+        key=lambda c: c[0]
+    )
+
+    bars = []
+    counts = []
+    current = None
+    for ts, o, h, l, c, base, usdt, quote in rows:
+        start = bucket_start(ts, target)
+        if current is not None and current[0] == start:
+            if h > current[2]:
+                current[2] = h
+            if l < current[3]:
+                current[3] = l
+            current[4] = c
+            current[5] += base
+            current[6] += usdt
+            current[7] += quote
+            counts[-1] += 1
+        else:
+            current = [start, o, h, l, c, base, usdt, quote]
+            bars.append(current)
+            counts.append(1)
+
+    if complete_only:
+        bars = [
+            bar for bar, count in zip(bars, counts)
+            if count * period == _bucket_end(bar[0], target) - bar[0]
+        ]
+    return bars
+
+
+def resample_all(
+    candles: Iterable[Sequence],
+    source: str,
+    targets: Iterable[str],
+    complete_only: bool = False
+) -> Dict[str, List[list]]:
+    """
+    Builds several granularities from one set of candles.
+
+    Returns:
+    - dict: Candles per target granularity.
+    """
+    candles = list(candles)
+    return {
+        target: resample_candles(candles, source, target, complete_only)
+        for target in targets
+    }
+
+
+def trades_to_bars(trades: Iterable[dict], granularity: str) -> List[list]:
+    """
+    Aggregates trades into OHLCV bars.
+
+    Args:
+    - trades (Iterable[dict]): Trades as returned by get_market_trades
+        or get_recent_trades (any order).
+    - granularity (str): Bar granularity, e.g. "1min".
+
+    Returns:
+    - list: Bars, oldest first, as
+        [ts, open, high, low, close, volume, quoteVolume, vwap, count].
+        Periods without trades are omitted.
+    """
+    rows = sorted(
+        (
+            (int(t["ts"]), int(t["tradeId"]),
+             float(t["price"]), float(t["size"]))
+            for t in trades
+        ),
+        key=lambda t: (t[0], t[1])
+    )
+
+    bars = []
+    current = None
+    for ts, _, price, size in rows:
+        start = bucket_start(ts, granularity)
+        if current is not None and current[0] == start:
+            if price > current[2]:
+                current[2] = price
+            if price < current[3]:
+                current[3] = price
+            current[4] = price
+            current[5] += size
+            current[6] += price * size
+            current[8] += 1
+        else:
+            current = [start, price, price, price, price,
+                       size, price * size, 0.0, 1]
+            bars.append(current)
+
+    for bar in bars:
+        bar[7] = bar[6] / bar[5] if bar[5] else bar[4]
+    return bars
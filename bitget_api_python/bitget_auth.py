@@ -1,33 +1,193 @@
 import hmac
 import base64
 import hashlib
+import heapq
+import itertools
+import json
+import re
+import socket
+import threading
 import time
 import requests
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
+from typing import Optional
 from requests import Response
+from requests.adapters import HTTPAdapter
+from requests.exceptions import Timeout
 # from requests.exceptions import ConnectionError
 from urllib.parse import urlencode
+from .exceptions import CircuitOpenError, DeadlineExceeded
+from .metrics import RequestMetrics
+from .rate_limit import RateLimiter
+from .scheduler import BULK, BULK_ENDPOINTS
+
+try:
+    import orjson
+except ImportError:  # optional, faster serializer
+    orjson = None
+
+DEFAULT_TIMEOUT = (5.0, 30.0)
+DEFAULT_POOL_SIZE = 32
+SUCCESS_MARKER = re.compile(rb'"code"\s*:\s*"00000"')
+# Read-only market data; safe to send twice.
+HEDGEABLE_PREFIXES = ("/api/v2/spot/market/", "/api/v2/spot/public/")
+
+
+def serialize_body(body) -> Optional[bytes]:
+    """
+    Serializes a request body to compact JSON bytes.
+
+    Uses orjson when it is installed. Strings and bytes are taken
+    as already serialized.
+
+    Args:
+    - body (dict, list, str or bytes): The request body.
+
+    Returns:
+    - bytes: The body exactly as it is signed and sent, or None.
+    """
+    if body is None or isinstance(body, bytes):
+        return body
+    if isinstance(body, str):
+        return body.encode()
+    if orjson is not None:
+        return orjson.dumps(body)
+    return json.dumps(
+        body, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+class _Watchdog:
+    """
+    Shuts down the sockets of requests still reading their body at
+    their deadline, so that a read blocked on one returns at once.
+
+    One daemon thread serves all requests from a heap of
+    [deadline_at, seq, socket] entries. A finished request removes its
+    entry; removed entries are dropped lazily, and the heap is rebuilt
+    once they make up half of it.
+
+    Methods:
+    - add(deadline_at, response) -> Optional[list]
+    - remove(entry) -> None
+    """
+
+    def __init__(self) -> None:
+        self._heap = []
+        self._removed = 0
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def add(self, deadline_at: float, response: Response) -> Optional[list]:
+        """
+        Watches the socket of a response until deadline_at (monotonic).
+
+        Returns:
+        - list: The entry to pass to remove(), or None if the response
+            has no socket.
+        """
+        connection = getattr(response.raw, "_connection", None)
+        sock = getattr(connection, "sock", None)
+        if sock is None:
+            return None
+        entry = [deadline_at, next(self._seq), sock]
+        with self._cond:
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="bitget-watchdog", daemon=True
+                )
+                self._thread.start()
+            elif self._heap[0] is entry:
+                self._cond.notify()
+        return entry
+
+    def remove(self, entry: list) -> None:
+        with self._cond:
+            if entry[2] is None:
+                # Already fired
+                return
+            entry[2] = None
+            self._removed += 1
+            if self._removed * 2 > len(self._heap):
+                self._heap = [item for item in self._heap if item[2]]
+                heapq.heapify(self._heap)
+                self._removed = 0
+
+    def _run(self) -> None:
+        with self._cond:
+            while True:
+                while self._heap and self._heap[0][2] is None:
+                    heapq.heappop(self._heap)
+                    self._removed -= 1
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                wait = self._heap[0][0] - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                entry = heapq.heappop(self._heap)
+                sock, entry[2] = entry[2], None
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+
+_watchdog = _Watchdog()
 
 
 class BitgetAuth:
     """
     Handles authentication for the Bitget API.
 
+    An instance can be shared by many threads. Each thread sends
+    through its own requests.Session; these sessions share the
+    connection pools of `session`, so no lock is taken on the request
+    path other than the rate limiter's, and per-call settings
+    (request_deadline, priority) are thread-local. Configuration
+    fields are meant to be set before the instance is shared.
+
     Methods:
-    - __init__(self, api_key, api_secret, api_passphrase) -> None
+    - __init__(self, api_key, api_secret, api_passphrase,
+               rate_limiter=None, session=None,
+               check_connection=True, timeout=DEFAULT_TIMEOUT,
+               deadline=None, hedge_percentile=None,
+               response_cache=None) -> None
     - get_timestamp() -> int
     - ping() -> bool
     - _pre_hash(timestamp, method, endpoint, params=None, body=None) -> str
     - sign(timestamp, method, endpoint, params=None, body=None) -> bytes
     - _headers(signature, timestamp) -> dict
     - get_headers(method, endpoint, params=None, body=None) -> dict
-    - get(endpoint, params=None, body=None) -> Response
+    - request_deadline(seconds) -> context manager
+    - priority(name) -> context manager
+    - _request(method, endpoint, params=None, body=None) -> Response
+    - get(endpoint, params=None, body=None, stream=False,
+          timeout=None, deadline=None) -> Response
+    - post(endpoint, params=None, body=None,
+           timeout=None, deadline=None) -> Response
 
     Fields:
     - api_key: The API key provided during initialization.
     - api_secret: The API secret provided during initialization.
     - api_passphrase: The API passphrase provided during initialization.
     - is_connected: A boolean indicating whether the instance
-        is connected to the Bitget API.
+        is connected to the Bitget API. Only written on creation.
+    - rate_limiter: Optional RateLimiter or PriorityScheduler
+        every request waits on.
+    - session: The requests.Session holding the connection pool.
+    - timeout: Default (connect, read) timeout in seconds.
+    - deadline: Default total time per request in seconds, or None.
+    - hedge_percentile: Latency percentile after which market GETs
+        are sent a second time, or None to disable hedging.
+    - metrics: RequestMetrics with per-endpoint latency and counters.
+    - response_cache: Optional ResponseCache for immutable GETs.
+    - circuit_breakers: Optional CircuitBreakers keyed by endpoint.
     - HOST: The base URL of the Bitget API.
     """
 
@@ -35,9 +195,20 @@ class BitgetAuth:
     api_secret: str
     api_passphrase: str
     is_connected: bool
+    rate_limiter: Optional[RateLimiter]
+    session: requests.Session
+    metrics: RequestMetrics
+    HEDGE_MIN_SAMPLES = 20
+    # Threads running hedged GETs; independent of the CPU count because
+    # they only wait on sockets.
+    HEDGE_WORKERS = 4 * DEFAULT_POOL_SIZE
     HOST = "https://api.bitget.com"
 
-    def __init__(self, api_key, api_secret, api_passphrase) -> None:
+    def __init__(self, api_key, api_secret, api_passphrase,
+                 rate_limiter=None, session=None,
+                 check_connection=True, timeout=DEFAULT_TIMEOUT,
+                 deadline=None, hedge_percentile=None,
+                 response_cache=None, circuit_breakers=None) -> None:
         """
         Initializes the BitgetAuth instance.
 
@@ -45,11 +216,51 @@ class BitgetAuth:
         - api_key (str): The API key.
         - api_secret (str): The API secret.
         - api_passphrase (str): The API passphrase.
+        - rate_limiter (RateLimiter, optional): Limiter shared by all
+            requests of this instance. Defaults to None (no limit).
+        - session (requests.Session, optional): Session whose
+            connection pools, headers and TLS settings are used; pass
+            the same session to several instances to share one pool.
+            Defaults to a new session with DEFAULT_POOL_SIZE
+            connections per host.
+        - check_connection (bool, optional): Ping the API on creation.
+            When False, is_connected is left False. Defaults to True.
+        - timeout (float or tuple, optional): Connect and read timeout
+            in seconds, as one number or a (connect, read) tuple.
+            Defaults to (5, 30).
+        - deadline (float, optional): Total time allowed per request,
+            including reading the body. Defaults to None.
+        - hedge_percentile (float, optional): E.g. 95. When a market
+            data GET has not answered within this percentile of its
+            recent latencies, a second identical request is sent and
+            the first answer wins. Defaults to None (disabled).
+        - response_cache (ResponseCache, optional): Disk cache serving
+            immutable historical GETs without a request.
+            Defaults to None.
+        - circuit_breakers (CircuitBreakers, optional): Fail requests
+            to an endpoint with CircuitOpenError, without sending them,
+            while its circuit is open. Defaults to None.
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.api_passphrase = api_passphrase
-        self.is_connected = self.ping()
+        self.rate_limiter = rate_limiter
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=DEFAULT_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.timeout = timeout
+        self.deadline = deadline
+        self.hedge_percentile = hedge_percentile
+        self.response_cache = response_cache
+        self.circuit_breakers = circuit_breakers
+        self.metrics = RequestMetrics()
+        self._local = threading.local()
+        self._hedge_executor = None
+        self._hedge_lock = threading.Lock()
+        self.is_connected = self.ping() if check_connection else False
 
     @staticmethod
     def get_timestamp() -> int:
@@ -68,8 +279,9 @@ class BitgetAuth:
         Returns:
         - bool: True if the connection is successful, False otherwise.
         """
-        res = requests.get(
-            self.HOST + "/api/v2/public/time"
+        res = self._thread_session().get(
+            self.HOST + "/api/v2/public/time",
+            timeout=self.timeout
         )
         if res.status_code == 200 and (
             "code" in res.json() and res.json()["code"] == 0
@@ -109,15 +321,22 @@ class BitgetAuth:
         - method (str): The HTTP method.
         - endpoint (str): The API endpoint.
         - params (dict, optional): The query parameters. Defaults to None.
-        - body (str, optional): The request body. Defaults to None.
+        - body (str or bytes, optional): The request body.
+            Defaults to None.
 
         Returns:
         - bytes: The base64-encoded signature.
         """
-        pre_hash = self._pre_hash(
-            timestamp, method, endpoint,
-            params, body
-        ).encode()
+        if isinstance(body, bytes):
+            # Sign the exact bytes that are sent.
+            pre_hash = self._pre_hash(
+                timestamp, method, endpoint, params
+            ).encode() + body
+        else:
+            pre_hash = self._pre_hash(
+                timestamp, method, endpoint,
+                params, body
+            ).encode()
         mac = hmac.new(self.api_secret.encode(), pre_hash, hashlib.sha256)
         return base64.b64encode(mac.digest())
 
@@ -157,7 +376,320 @@ class BitgetAuth:
         signature = self.sign(timestamp, method, endpoint, params, body)
         return self._headers(signature, timestamp)
 
-    def get(self, endpoint, params=None, body=None) -> Response:
+    @contextmanager
+    def request_deadline(self, seconds):
+        """
+        Limits the total time of all requests made by this thread
+        inside the block, e.g. around several mixin calls.
+
+        Args:
+        - seconds (float): Time budget for the block.
+        """
+        previous = getattr(self._local, "deadline_at", None)
+        deadline_at = time.monotonic() + seconds
+        if previous is not None:
+            deadline_at = min(previous, deadline_at)
+        self._local.deadline_at = deadline_at
+        try:
+            yield
+        finally:
+            self._local.deadline_at = previous
+
+    @contextmanager
+    def priority(self, name):
+        """
+        Sets the PriorityScheduler class of requests made by this
+        thread inside the block, e.g. "interactive" or "bulk".
+
+        Without it, backfill endpoints (BULK_ENDPOINTS) are scheduled
+        as bulk and everything else as the scheduler's default class.
+
+        Args:
+        - name (str): Priority class name.
+        """
+        previous = getattr(self._local, "priority", None)
+        self._local.priority = name
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    def _priority(self, endpoint) -> Optional[str]:
+        priority = getattr(self._local, "priority", None)
+        if priority is None and endpoint in BULK_ENDPOINTS:
+            return BULK
+        return priority
+
+    def _deadline_at(self, deadline) -> Optional[float]:
+        if deadline is None:
+            deadline = self.deadline
+        deadline_at = getattr(self._local, "deadline_at", None)
+        if deadline is not None:
+            call_deadline_at = time.monotonic() + deadline
+            if deadline_at is None or call_deadline_at < deadline_at:
+                deadline_at = call_deadline_at
+        return deadline_at
+
+    def _timeouts(self, timeout, deadline_at) -> tuple:
+        if timeout is None:
+            timeout = self.timeout
+        if timeout is None or isinstance(timeout, (int, float)):
+            connect = read = timeout
+        else:
+            connect, read = timeout
+        if deadline_at is not None:
+            remaining = deadline_at - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceeded("deadline exceeded before sending")
+            connect = min(connect or remaining, remaining)
+            read = min(read or remaining, remaining)
+        return connect, read
+
+    def _thread_session(self) -> requests.Session:
+        """
+        Returns this thread's session, which shares the adapters
+        (connection pools) of self.session.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None or session.adapters is not self.session.adapters:
+            template = self.session
+            session = requests.Session()
+            session.adapters = template.adapters
+            session.headers = template.headers.copy()
+            session.auth = template.auth
+            session.proxies = template.proxies.copy()
+            session.verify = template.verify
+            session.cert = template.cert
+            session.trust_env = template.trust_env
+            self._local.session = session
+        return session
+
+    def _send(self, method, endpoint, params, body, timeout,
+              deadline_at, stream, priority=None, sent=None) -> Response:
+        """
+        Sends one request and records its metrics.
+
+        `sent` (threading.Event, optional) is set once the rate limiter
+        let the request through.
+        """
+        if self.circuit_breakers is not None:
+            try:
+                self.metrics.set_circuit(
+                    endpoint, self.circuit_breakers.before(endpoint)
+                )
+            except CircuitOpenError:
+                self.metrics.increment(endpoint, "rejected")
+                self.metrics.set_circuit(
+                    endpoint, self.circuit_breakers.state(endpoint)
+                )
+                raise
+        try:
+            if self.rate_limiter is not None:
+                if deadline_at is None:
+                    self.rate_limiter.acquire(priority=priority)
+                else:
+                    try:
+                        self.rate_limiter.acquire(
+                            priority=priority,
+                            timeout=max(0.0, deadline_at - time.monotonic())
+                        )
+                    except TimeoutError:
+                        raise DeadlineExceeded(
+                            "deadline exceeded waiting for the rate limiter"
+                        ) from None
+            timeouts = self._timeouts(timeout, deadline_at)
+        except BaseException:
+            # Never sent: says nothing about the endpoint
+            if self.circuit_breakers is not None:
+                self.circuit_breakers.release(endpoint)
+            raise
+        if sent is not None:
+            sent.set()
+        started = time.monotonic()
+        watchdog = None
+        try:
+            response = self._thread_session().request(
+                method,
+                self.HOST + endpoint,
+                headers=self.get_headers(
+                    method, endpoint, params, body
+                ),
+                params=params,
+                data=body,
+                timeout=timeouts,
+                stream=stream or deadline_at is not None
+            )
+            if deadline_at is not None and not stream:
+                # Socket timeouts bound each read, not the whole body;
+                # the watchdog cuts a slowly trickling body off.
+                watchdog = _watchdog.add(deadline_at, response)
+                chunks = []
+                for chunk in response.iter_content(65536):
+                    chunks.append(chunk)
+                    if time.monotonic() > deadline_at:
+                        break
+                if time.monotonic() > deadline_at:
+                    response.close()
+                    raise DeadlineExceeded(
+                        "deadline exceeded while reading the body"
+                    )
+                response._content = b"".join(chunks)
+        except Timeout as exc:
+            # A timeout forced by the caller's deadline only counts
+            # against the endpoint if it was also slow.
+            cut_short = (deadline_at is not None
+                         and time.monotonic() >= deadline_at)
+            self._observe(
+                endpoint, time.monotonic() - started, timeout=True,
+                cut_short=cut_short
+            )
+            if cut_short and not isinstance(exc, DeadlineExceeded):
+                raise DeadlineExceeded(str(exc)) from exc
+            raise
+        except Exception as exc:
+            if watchdog is not None and time.monotonic() > deadline_at:
+                # The watchdog closed the connection
+                self._observe(
+                    endpoint, time.monotonic() - started, timeout=True,
+                    cut_short=True
+                )
+                response.close()
+                raise DeadlineExceeded(
+                    "deadline exceeded while reading the body"
+                ) from exc
+            self._observe(
+                endpoint, time.monotonic() - started, error=True
+            )
+            raise
+        finally:
+            if watchdog is not None:
+                _watchdog.remove(watchdog)
+        self._observe(
+            endpoint, time.monotonic() - started,
+            error=response.status_code >= 500
+        )
+        return response
+
+    def _observe(self, endpoint, seconds, error=False,
+                 timeout=False, cut_short=False) -> None:
+        """
+        Records a sent request in the metrics and circuit breaker.
+        A request cut short by its deadline has no known outcome.
+        """
+        self.metrics.observe(endpoint, seconds, error=error, timeout=timeout)
+        if self.circuit_breakers is not None:
+            failed = None if cut_short else error or timeout
+            self.metrics.set_circuit(endpoint, self.circuit_breakers.after(
+                endpoint, seconds, failed=failed
+            ))
+
+    def _hedged(self, endpoint, attempt) -> Response:
+        """
+        Runs attempt, and runs it a second time if the first call is
+        slower than hedge_percentile of recent latencies.
+        """
+        delay = self.metrics.percentile(
+            endpoint, self.hedge_percentile, self.HEDGE_MIN_SAMPLES
+        )
+        if delay is None:
+            return attempt()
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=self.HEDGE_WORKERS,
+                    thread_name_prefix="bitget-hedge"
+                )
+        executor = self._hedge_executor
+
+        # The hedge delay starts when the request is sent, not while it
+        # is queued for a worker or waiting on the rate limiter.
+        sent = threading.Event()
+        first = executor.submit(attempt, sent=sent)
+        first.add_done_callback(lambda f: sent.set())
+        sent.wait()
+        done, _ = wait([first], timeout=delay)
+        if done:
+            return first.result()
+        self.metrics.increment(endpoint, "hedges")
+        second = executor.submit(attempt)
+        pending = {first, second}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                if future is second:
+                    self.metrics.increment(endpoint, "hedge_wins")
+                for loser in pending:
+                    loser.add_done_callback(
+                        lambda f: f.exception() is None and f.result().close()
+                    )
+                return future.result()
+        raise error
+
+    def _request(self, method, endpoint, params=None, body=None,
+                 timeout=None, deadline=None, stream=False) -> Response:
+        """
+        Signs and sends a request, waiting for the rate limiter first.
+
+        Args:
+        - method (str): The HTTP method.
+        - endpoint (str): The API endpoint.
+        - params (dict, optional): The query parameters. Defaults to None.
+        - body (dict, str or bytes, optional): The request body;
+            serialized once and signed and sent as the same bytes.
+            Defaults to None.
+        - timeout (float or tuple, optional): Overrides self.timeout.
+        - deadline (float, optional): Overrides self.deadline.
+        - stream (bool, optional): Leave the body unread.
+
+        Returns:
+        - Response
+
+        Raises:
+        - requests.exceptions.Timeout: On connect or read timeout.
+        - DeadlineExceeded: When the total deadline passes.
+        - CircuitOpenError: When the endpoint's circuit is open.
+        """
+        cache_key = None
+        if (self.response_cache is not None and method == "GET"
+                and not stream
+                and self.response_cache.is_immutable(endpoint, params)):
+            cache_key = self.response_cache.key(method, endpoint, params)
+            content = self.response_cache.get(cache_key)
+            if content is not None:
+                return self._cached_response(endpoint, content)
+
+        attempt = partial(
+            self._send, method, endpoint, params, serialize_body(body),
+            timeout, self._deadline_at(deadline), stream,
+            self._priority(endpoint)
+        )
+        if (self.hedge_percentile is not None and method == "GET"
+                and not stream
+                and endpoint.startswith(HEDGEABLE_PREFIXES)):
+            response = self._hedged(endpoint, attempt)
+        else:
+            response = attempt()
+
+        if (cache_key is not None and response.status_code == 200
+                and SUCCESS_MARKER.search(response.content, 0, 128)):
+            self.response_cache.put(cache_key, response.content)
+        return response
+
+    def _cached_response(self, endpoint, content) -> Response:
+        response = Response()
+        response.status_code = 200
+        response.url = self.HOST + endpoint
+        response.headers["Content-Type"] = "application/json"
+        response.encoding = "utf-8"
+        response._content = content
+        return response
+
+    def get(self, endpoint, params=None, body=None, stream=False,
+            timeout=None, deadline=None) -> Response:
         """
         Makes a GET request to the Bitget API.
 
@@ -165,38 +697,40 @@ class BitgetAuth:
         - endpoint (str): The API endpoint.
         - params (dict, optional): The query parameters. Defaults to None.
         - body (str, optional): The request body. Defaults to None.
+        - stream (bool, optional): Leave the body unread so it can be
+            decoded incrementally with iter_data(). Defaults to False.
+        - timeout (float or tuple, optional): Connect/read timeout for
+            this call. Defaults to the client timeout.
+        - deadline (float, optional): Total time for this call.
+            Defaults to the client deadline.
 
         Returns:
         - Response
         """
-        url = self.HOST + endpoint
-        response = requests.get(
-            url,
-            headers=self.get_headers(
-                "GET", endpoint, params, body
-            ),
-            params=params
+        return self._request(
+            "GET", endpoint, params, body,
+            timeout=timeout, deadline=deadline, stream=stream
         )
-        return response
 
-    def post(self, endpoint, params=None, body=None) -> Response:
+    def post(self, endpoint, params=None, body=None,
+             timeout=None, deadline=None) -> Response:
         """
         Makes a POST request to the Bitget API.
 
         Args:
         - endpoint (str): The API endpoint.
         - params (dict, optional): The query parameters. Defaults to None.
-        - body (str, optional): The request body. Defaults to None.
+        - body (dict, str or bytes, optional): The JSON request body.
+            Defaults to None.
+        - timeout (float or tuple, optional): Connect/read timeout for
+            this call. Defaults to the client timeout.
+        - deadline (float, optional): Total time for this call.
+            Defaults to the client deadline.
 
         Returns:
         - Response
         """
-        url = self.HOST + endpoint
-        response = requests.post(
-            url,
-            headers=self.get_headers(
-                "POST", endpoint, params, body
-            ),
-            params=params
+        return self._request(
+            "POST", endpoint, params, body,
+            timeout=timeout, deadline=deadline
         )
-        return response
@@ -2,7 +2,8 @@ from .bitget_auth import BitgetAuth
 from . import mixins
 
 
-class Client(BitgetAuth, mixins.AccountMixin, mixins.MarketMixin):
+class Client(BitgetAuth, mixins.AccountMixin,
+             mixins.MarketMixin, mixins.TradeMixin):
     """
     Bitget API Client.
     """
@@ -0,0 +1,165 @@
+import hashlib
+import os
+import threading
+import time
+import zlib
+from typing import Optional
+from urllib.parse import urlencode
+from .aggregation import DAY_MS, GRANULARITIES
+"""
+Persistent cache for responses that can no longer change
+"""
+
+HISTORY_CANDLES = "/api/v2/spot/market/history-candles"
+CANDLES = "/api/v2/spot/market/candles"
+MARKET_TRADES = "/api/v2/spot/market/fills-history"
+MONTH_MS = 31 * DAY_MS
+
+
+class ResponseCache:
+    """
+    Size-bounded, content-addressed disk cache of immutable GETs.
+
+    A request is immutable when everything it can return lies in the
+    past: candles whose last bar closed before now, and trades whose
+    endTime (or idLessThan bound) is already history. Bodies are stored
+    zlib-compressed under the SHA-256 of the request; the least
+    recently used files are removed when the cache exceeds max_bytes.
+
+    Methods:
+    - __init__(self, directory, max_bytes=1 GiB, ...) -> None
+    - is_immutable(endpoint, params, now=None) -> bool
+    - key(method, endpoint, params) -> str
+    - get(key) -> Optional[bytes]
+    - put(key, content) -> None
+    - clear() -> None
+
+    Fields:
+    - hits, misses: Lookup counters.
+    - size: Bytes currently stored.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 1 << 30,
+        settle_ms: int = 60 * 1000,
+        compression_level: int = 6
+    ) -> None:
+        """
+        Initializes the ResponseCache instance.
+
+        Args:
+        - directory (str): Cache directory, created if missing.
+        - max_bytes (int, optional): Size limit. Defaults to 1 GiB.
+        - settle_ms (int, optional): Time after a period ends before it
+            is treated as final. Defaults to one minute.
+        - compression_level (int, optional): zlib level.
+            Defaults to 6.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.settle_ms = settle_ms
+        self.compression_level = compression_level
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.size = sum(
+            entry.stat().st_size for entry in os.scandir(directory)
+            if entry.is_file() and entry.name.endswith(".z")
+        )
+
+    def is_immutable(self, endpoint: str, params: Optional[dict],
+                     now: Optional[int] = None) -> bool:
+        """
+        Tells whether the response to a GET can never change.
+        """
+        params = params or {}
+        now = now if now is not None else int(time.time() * 1000)
+        if endpoint in (HISTORY_CANDLES, CANDLES):
+            end_time = params.get("endTime")
+            if not end_time:
+                return False
+            granularity = params.get("granularity")
+            if granularity in GRANULARITIES:
+                period = GRANULARITIES[granularity][0]
+            else:
+                period = MONTH_MS
+            return int(end_time) + period + self.settle_ms <= now
+        if endpoint == MARKET_TRADES:
+            if params.get("endTime"):
+                return int(params["endTime"]) + self.settle_ms <= now
+            return bool(params.get("idLessThan"))
+        return False
+
+    @staticmethod
+    def key(method: str, endpoint: str, params: Optional[dict]) -> str:
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.sha256(
+            f"{method} {endpoint}?{query}".encode()
+        ).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".z")
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Returns the cached body, or None.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                content = zlib.decompress(f.read())
+            os.utime(path)
+        except (FileNotFoundError, zlib.error):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return content
+
+    def put(self, key: str, content: bytes) -> None:
+        """
+        Stores a body and evicts old entries if over the size limit.
+        """
+        data = zlib.compress(content, self.compression_level)
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        with self._lock:
+            try:
+                self.size -= os.path.getsize(path)
+            except FileNotFoundError:
+                pass
+            os.replace(tmp_path, path)
+            self.size += len(data)
+            if self.size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        # Oldest access first, down to 90% of the limit
+        entries = sorted(
+            (entry for entry in os.scandir(self.directory)
+             if entry.is_file() and entry.name.endswith(".z")),
+            key=lambda entry: entry.stat().st_mtime
+        )
+        target = self.max_bytes * 0.9
+        for entry in entries:
+            if self.size <= target:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+            except FileNotFoundError:
+                continue
+            self.size -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".z"):
+                    os.remove(entry.path)
+            self.size = 0
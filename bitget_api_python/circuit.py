@@ -0,0 +1,235 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+from .exceptions import CircuitOpenError
+"""
+Per-endpoint circuit breakers
+"""
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit state of one endpoint.
+
+    Fields:
+    - state: "closed", "open" or "half_open".
+    - outcomes: Recent outcomes, True for a failure.
+    - opened_at: monotonic() time the circuit last opened.
+    - probes: Probe requests in flight while half-open.
+    - successes: Successful probes since the circuit half-opened.
+    - trips: Times the circuit opened.
+    """
+
+    def __init__(self, window: int) -> None:
+        self.lock = threading.Lock()
+        self.state = CLOSED
+        self.outcomes = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.probes = 0
+        self.successes = 0
+        self.trips = 0
+
+
+class CircuitBreakers:
+    """
+    Thread-safe collection of CircuitBreaker, one per endpoint.
+
+    A closed circuit opens when at least min_requests of the last
+    `window` requests were made and failure_rate of them failed. A
+    request fails when it raises, times out, returns HTTP >= 500 or,
+    with slow_seconds set, takes that long or longer. An open circuit
+    rejects requests with CircuitOpenError for open_seconds, then lets
+    `probes` requests through; the circuit closes when they all
+    succeed and opens again as soon as one fails. Requests that were
+    never sent, or were cut short by the caller's deadline before
+    slow_seconds, are released without an outcome.
+
+    Methods:
+    - __init__(self, failure_rate=0.5, min_requests=10, ...) -> None
+    - before(endpoint) -> str
+    - after(endpoint, seconds, failed=False) -> str
+    - release(endpoint) -> str
+    - state(endpoint) -> str
+    - reset(endpoint=None) -> None
+    - snapshot() -> dict
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_requests: int = 10,
+        window: int = 20,
+        slow_seconds: Optional[float] = None,
+        open_seconds: float = 30.0,
+        probes: int = 1
+    ) -> None:
+        """
+        Initializes the CircuitBreakers instance.
+
+        Args:
+        - failure_rate (float, optional): Share of failed requests in
+            the window that opens the circuit. Defaults to 0.5.
+        - min_requests (int, optional): Requests in the window before
+            the circuit may open. Defaults to 10.
+        - window (int, optional): Outcomes kept per endpoint.
+            Defaults to 20.
+        - slow_seconds (float, optional): Latency counted as a failure.
+            Defaults to None (latency is ignored).
+        - open_seconds (float, optional): Time an open circuit rejects
+            requests before probing. Defaults to 30.0.
+        - probes (int, optional): Successful probes needed to close the
+            circuit. Defaults to 1.
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be in (0, 1]")
+        if not 0 < min_requests <= window:
+            raise ValueError("need 0 < min_requests <= window")
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window = window
+        self.slow_seconds = slow_seconds
+        self.open_seconds = open_seconds
+        self.probes = max(1, probes)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def _get(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers.setdefault(
+                endpoint, CircuitBreaker(self.window)
+            )
+        return breaker
+
+    def _open(self, breaker: CircuitBreaker, now: float) -> None:
+        breaker.state = OPEN
+        breaker.opened_at = now
+        breaker.probes = 0
+        breaker.successes = 0
+        breaker.trips += 1
+
+    def before(self, endpoint: str) -> str:
+        """
+        Admits a request or rejects it while the circuit is open.
+        Every admitted request must be reported with after() or
+        release().
+
+        Returns:
+        - str: The state the request was admitted in.
+
+        Raises:
+        - CircuitOpenError: If the circuit is open, or half-open with
+            all probes in flight.
+        """
+        breaker = self._get(endpoint)
+        now = time.monotonic()
+        with breaker.lock:
+            if breaker.state == CLOSED:
+                return CLOSED
+            retry_after = breaker.opened_at + self.open_seconds - now
+            if breaker.state == OPEN:
+                if retry_after > 0:
+                    raise CircuitOpenError(endpoint, retry_after)
+                breaker.state = HALF_OPEN
+                breaker.opened_at = now
+                retry_after = self.open_seconds
+            elif retry_after <= 0:
+                # Probes that never reported back are given up on
+                breaker.opened_at = now
+                breaker.probes = 0
+                retry_after = self.open_seconds
+            if breaker.probes + breaker.successes >= self.probes:
+                raise CircuitOpenError(endpoint, retry_after)
+            breaker.probes += 1
+            return HALF_OPEN
+
+    def after(self, endpoint: str, seconds: float,
+              failed: Optional[bool] = False) -> str:
+        """
+        Records the outcome of an admitted request.
+
+        Args:
+        - endpoint (str): The API endpoint.
+        - seconds (float): Latency of the request.
+        - failed (bool, optional): Whether the request failed; None
+            when the outcome is unknown, in which case only a latency
+            of slow_seconds or more counts (as a failure).
+
+        Returns:
+        - str: The state of the circuit afterwards.
+        """
+        slow = self.slow_seconds is not None and seconds >= self.slow_seconds
+        if failed is None and not slow:
+            return self.release(endpoint)
+        failed = failed or slow
+        breaker = self._get(endpoint)
+        now = time.monotonic()
+        with breaker.lock:
+            if breaker.state == CLOSED:
+                breaker.outcomes.append(failed)
+                total = len(breaker.outcomes)
+                if (failed and total >= self.min_requests
+                        and sum(breaker.outcomes)
+                        >= self.failure_rate * total):
+                    self._open(breaker, now)
+            elif breaker.state == HALF_OPEN:
+                breaker.probes = max(0, breaker.probes - 1)
+                if failed:
+                    self._open(breaker, now)
+                else:
+                    breaker.successes += 1
+                    if breaker.successes >= self.probes:
+                        breaker.state = CLOSED
+                        breaker.outcomes.clear()
+                        breaker.successes = 0
+            # Requests admitted before the circuit opened do not
+            # change an open circuit.
+            return breaker.state
+
+    def release(self, endpoint: str) -> str:
+        """
+        Ends an admitted request without recording an outcome, e.g.
+        when it was never sent; frees its probe slot if half-open.
+
+        Returns:
+        - str: The state of the circuit.
+        """
+        breaker = self._get(endpoint)
+        with breaker.lock:
+            if breaker.state == HALF_OPEN:
+                breaker.probes = max(0, breaker.probes - 1)
+            return breaker.state
+
+    def state(self, endpoint: str) -> str:
+        breaker = self._breakers.get(endpoint)
+        return breaker.state if breaker is not None else CLOSED
+
+    def reset(self, endpoint: Optional[str] = None) -> None:
+        """
+        Closes one circuit, or all of them.
+        """
+        if endpoint is None:
+            self._breakers.clear()
+        else:
+            self._breakers.pop(endpoint, None)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Returns state, recent failure rate and trips per endpoint.
+        """
+        result = {}
+        for endpoint, breaker in list(self._breakers.items()):
+            with breaker.lock:
+                total = len(breaker.outcomes)
+                result[endpoint] = {
+                    "state": breaker.state,
+                    "failure_rate": (
+                        sum(breaker.outcomes) / total if total else 0.0
+                    ),
+                    "trips": breaker.trips,
+                }
+        return result
@@ -0,0 +1,216 @@
+import argparse
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from .bitget_client import Client
+from .rate_limit import SharedRateLimiter
+from .utils import response_data
+"""
+Bulk download of market data
+
+Usage:
+    python -m bitget_api_python BTCUSDT ETHUSDT -g 1min 1h --trades \\
+        --start 2024-01-01 --end 2024-02-01 --out data
+"""
+
+CANDLE_FIELDS = [
+    "ts", "open", "high", "low", "close",
+    "baseVolume", "usdtVolume", "quoteVolume",
+]
+TRADE_FIELDS = ["tradeId", "ts", "side", "price", "size"]
+CANDLES_PAGE_LIMIT = 200
+TRADES_PAGE_LIMIT = 1000
+TRADES_WINDOW_MS = 7 * 24 * 60 * 60 * 1000
+
+_client: Optional[Client] = None
+
+
+def _init_worker(rate_limiter: SharedRateLimiter) -> None:
+    global _client
+    _client = Client(
+        os.environ.get("BITGET_API_KEY", ""),
+        os.environ.get("BITGET_API_SECRET", ""),
+        os.environ.get("BITGET_API_PASSPHRASE", ""),
+        rate_limiter=rate_limiter,
+        check_connection=False,
+    )
+
+
+def download_candles(client, symbol: str, granularity: str,
+                     start: int, end: int, path: str) -> int:
+    """
+    Writes candles of [start, end) to a CSV file, newest first.
+
+    Returns:
+    - int: Number of rows written.
+    """
+    rows = 0
+    end_time = end
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(CANDLE_FIELDS)
+        while end_time > start:
+            page = response_data(client.get_history_candlestick_data(
+                symbol, granularity, str(end_time),
+                limit=str(CANDLES_PAGE_LIMIT)
+            )) or []
+            page = sorted(
+                (c for c in page if start <= int(c[0]) < end_time),
+                key=lambda c: int(c[0]), reverse=True
+            )
+            if not page:
+                break
+            writer.writerows(c[:len(CANDLE_FIELDS)] for c in page)
+            rows += len(page)
+            end_time = int(page[-1][0])
+    return rows
+
+
+def download_trades(client, symbol: str,
+                    start: int, end: int, path: str) -> int:
+    """
+    Writes trades of [start, end) to a CSV file, newest first.
+
+    The range is walked in 7-day windows (the API maximum) and each
+    window is paged with idLessThan.
+
+    Returns:
+    - int: Number of rows written.
+    """
+    rows = 0
+    window_end = end
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(
+            f, fieldnames=TRADE_FIELDS, extrasaction="ignore"
+        )
+        writer.writeheader()
+        while window_end > start:
+            window_start = max(start, window_end - TRADES_WINDOW_MS)
+            id_less_than = None
+            while True:
+                page = response_data(client.get_market_trades(
+                    symbol,
+                    limit=str(TRADES_PAGE_LIMIT),
+                    idLessThan=id_less_than,
+                    startTime=str(window_start),
+                    endTime=str(window_end - 1),
+                )) or []
+                writer.writerows(page)
+                rows += len(page)
+                if len(page) < TRADES_PAGE_LIMIT:
+                    break
+                id_less_than = page[-1]["tradeId"]
+            window_end = window_start
+    return rows
+
+
+def _run_task(task: Tuple) -> Tuple[Tuple, int, float]:
+    kind, symbol, granularity, start, end, path = task
+    started = time.monotonic()
+    if kind == "candles":
+        rows = download_candles(
+            _client, symbol, granularity, start, end, path
+        )
+    else:
+        rows = download_trades(_client, symbol, start, end, path)
+    return task, rows, time.monotonic() - started
+
+
+def _parse_time(value: str) -> int:
+    if value.isdigit():
+        return int(value)
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp() * 1000)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m bitget_api_python",
+        description="Download Bitget spot candles and trade history.",
+    )
+    parser.add_argument("symbols", nargs="+", help="e.g. BTCUSDT ETHUSDT")
+    parser.add_argument(
+        "-g", "--granularity", nargs="*", default=[],
+        help="candle granularities, e.g. 1min 15min 1h",
+    )
+    parser.add_argument(
+        "--trades", action="store_true", help="also download trades"
+    )
+    parser.add_argument(
+        "--start", required=True, type=_parse_time,
+        help="start time: ISO date (UTC) or Unix ms",
+    )
+    parser.add_argument(
+        "--end", type=_parse_time, default=None,
+        help="end time: ISO date (UTC) or Unix ms (default: now)",
+    )
+    parser.add_argument("--out", default="bitget_data", help="output dir")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 4,
+        help="worker processes",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=10,
+        help="requests per second shared by all workers",
+    )
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if not args.granularity and not args.trades:
+        print("nothing to do: pass --granularity and/or --trades",
+              file=sys.stderr)
+        return 2
+    end = args.end or int(time.time() * 1000)
+
+    tasks = []
+    for symbol in args.symbols:
+        for granularity in args.granularity:
+            directory = os.path.join(args.out, "candles")
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"{symbol}_{granularity}.csv")
+            tasks.append(
+                ("candles", symbol, granularity, args.start, end, path)
+            )
+        if args.trades:
+            directory = os.path.join(args.out, "trades")
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"{symbol}.csv")
+            tasks.append(("trades", symbol, None, args.start, end, path))
+
+    rate_limiter = SharedRateLimiter(args.rate)
+    started = time.monotonic()
+    total_rows = 0
+    failed = 0
+    with ProcessPoolExecutor(
+        max_workers=min(args.workers, len(tasks)),
+        initializer=_init_worker,
+        initargs=(rate_limiter,),
+    ) as executor:
+        futures = {executor.submit(_run_task, task): task for task in tasks}
+        for done, future in enumerate(as_completed(futures), 1):
+            kind, symbol, granularity = futures[future][:3]
+            name = " ".join(filter(None, (kind, symbol, granularity)))
+            try:
+                _, rows, seconds = future.result()
+            except Exception as exc:
+                failed += 1
+                print(f"[{done}/{len(tasks)}] {name}: failed: {exc}",
+                      file=sys.stderr)
+                continue
+            total_rows += rows
+            elapsed = time.monotonic() - started
+            print(
+                f"[{done}/{len(tasks)}] {name}: {rows} rows in "
+                f"{seconds:.1f}s | total {total_rows} rows, "
+                f"{total_rows / max(elapsed, 1e-9):.0f} rows/s",
+                file=sys.stderr,
+            )
+    return 1 if failed else 0
@@ -0,0 +1,44 @@
+from requests.exceptions import RequestException, Timeout
+"""
+Exceptions raised by the client helpers
+"""
+
+
+class BitgetAPIError(Exception):
+    """
+    The API answered with an HTTP error or a non-success "code".
+
+    Fields:
+    - code: The Bitget error code (or the HTTP status as a string).
+    - msg: The error message returned by the API.
+    - status_code: The HTTP status code of the response.
+    """
+
+    def __init__(self, code: str, msg: str, status_code: int) -> None:
+        super().__init__(f"{code}: {msg} (HTTP {status_code})")
+        self.code = code
+        self.msg = msg
+        self.status_code = status_code
+
+
+class DeadlineExceeded(Timeout):
+    """
+    The request did not complete within its total deadline.
+    """
+
+
+class CircuitOpenError(RequestException):
+    """
+    The endpoint's circuit breaker is open; the request was not sent.
+
+    Fields:
+    - endpoint: The rejected endpoint.
+    - retry_after: Seconds until the circuit lets a probe through.
+    """
+
+    def __init__(self, endpoint: str, retry_after: float) -> None:
+        super().__init__(
+            f"circuit open for {endpoint}, retry in {retry_after:.1f}s"
+        )
+        self.endpoint = endpoint
+        self.retry_after = retry_after
@@ -0,0 +1,330 @@
+import json
+import sqlite3
+import time
+from typing import Callable, List, Optional
+from .utils import response_data
+"""
+Local SQLite ledger of wallet records
+"""
+
+DAY_MS = 24 * 60 * 60 * 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS deposits (
+    order_id TEXT PRIMARY KEY,
+    trade_id TEXT,
+    coin TEXT NOT NULL,
+    type TEXT,
+    size TEXT,
+    status TEXT,
+    chain TEXT,
+    to_address TEXT,
+    c_time INTEGER NOT NULL,
+    u_time INTEGER,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS deposits_coin_time ON deposits (coin, c_time);
+CREATE INDEX IF NOT EXISTS deposits_time ON deposits (c_time);
+
+CREATE TABLE IF NOT EXISTS withdrawals (
+    order_id TEXT PRIMARY KEY,
+    client_oid TEXT,
+    trade_id TEXT,
+    coin TEXT NOT NULL,
+    type TEXT,
+    size TEXT,
+    fee TEXT,
+    status TEXT,
+    chain TEXT,
+    to_address TEXT,
+    c_time INTEGER NOT NULL,
+    u_time INTEGER,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS withdrawals_coin_time
+    ON withdrawals (coin, c_time);
+CREATE INDEX IF NOT EXISTS withdrawals_time ON withdrawals (c_time);
+CREATE INDEX IF NOT EXISTS withdrawals_client_oid ON withdrawals (client_oid);
+
+CREATE TABLE IF NOT EXISTS transfers (
+    transfer_id TEXT PRIMARY KEY,
+    client_oid TEXT,
+    coin TEXT NOT NULL,
+    from_type TEXT,
+    to_type TEXT,
+    from_symbol TEXT,
+    to_symbol TEXT,
+    size TEXT,
+    status TEXT,
+    c_time INTEGER NOT NULL,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transfers_coin_time ON transfers (coin, c_time);
+CREATE INDEX IF NOT EXISTS transfers_time ON transfers (c_time);
+CREATE INDEX IF NOT EXISTS transfers_client_oid ON transfers (client_oid);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    kind TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    last_time INTEGER NOT NULL,
+    PRIMARY KEY (kind, scope)
+);
+"""
+
+# table -> (primary key column, {column: record field})
+_TABLES = {
+    "deposits": ("order_id", {
+        "order_id": "orderId",
+        "trade_id": "tradeId",
+        "coin": "coin",
+        "type": "type",
+        "size": "size",
+        "status": "status",
+        "chain": "chain",
+        "to_address": "toAddress",
+        "c_time": "cTime",
+        "u_time": "uTime",
+    }),
+    "withdrawals": ("order_id", {
+        "order_id": "orderId",
+        "client_oid": "clientOid",
+        "trade_id": "tradeId",
+        "coin": "coin",
+        "type": "type",
+        "size": "size",
+        "fee": "fee",
+        "status": "status",
+        "chain": "chain",
+        "to_address": "toAddress",
+        "c_time": "cTime",
+        "u_time": "uTime",
+    }),
+    "transfers": ("transfer_id", {
+        "transfer_id": "transferId",
+        "client_oid": "clientOid",
+        "coin": "coin",
+        "from_type": "fromType",
+        "to_type": "toType",
+        "from_symbol": "fromSymbol",
+        "to_symbol": "toSymbol",
+        "size": "size",
+        "status": "status",
+        "c_time": "ts",
+    }),
+}
+
+
+class Ledger:
+    """
+    Local copy of deposit, withdrawal and transfer records.
+
+    Each sync_* call fetches only the records created since the last
+    synced record of the same coin (minus a short lookback, so status
+    changes of recent records are picked up) and upserts them by
+    orderId / transferId. Queries are then served from SQLite.
+
+    Methods:
+    - __init__(self, client, path="bitget_ledger.db", ...) -> None
+    - sync_deposits(coin=None) -> int
+    - sync_withdrawals(coin=None) -> int
+    - sync_transfers(coin, from_type) -> int
+    - deposits(coin=None, start_time=None, end_time=None, status=None)
+    - withdrawals(coin=None, start_time=None, end_time=None, status=None)
+    - transfers(coin=None, start_time=None, end_time=None, status=None)
+    - close() -> None
+
+    Fields:
+    - PAGE_LIMIT: Records requested per page.
+    """
+
+    PAGE_LIMIT = 100
+
+    def __init__(
+        self,
+        client,
+        path: str = "bitget_ledger.db",
+        since: Optional[int] = None,
+        lookback_ms: int = DAY_MS,
+        window_ms: int = 90 * DAY_MS
+    ) -> None:
+        """
+        Initializes the Ledger instance.
+
+        Args:
+        - client (Client): The API client.
+        - path (str, optional): SQLite database file.
+            Defaults to "bitget_ledger.db".
+        - since (int, optional): Start of the first sync (Unix ms).
+            Defaults to one year ago.
+        - lookback_ms (int, optional): How far before the last synced
+            record a sync starts again. Defaults to one day.
+        - window_ms (int, optional): Time range per query.
+            Defaults to 90 days.
+        """
+        self.client = client
+        self.since = since if since is not None else (
+            int(time.time() * 1000) - 365 * DAY_MS
+        )
+        self.lookback_ms = lookback_ms
+        self.window_ms = window_ms
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def sync_deposits(self, coin: Optional[str] = None) -> int:
+        """
+        Fetches new deposit records.
+
+        Args:
+        - coin (str, optional): Coin name. Defaults to all coins.
+
+        Returns:
+        - int: Number of records fetched.
+        """
+        def fetch(start, end, cursor):
+            return self.client.get_deposit_records(
+                str(start), str(end), coin=coin,
+                id_less_than=cursor, limit=self.PAGE_LIMIT
+            )
+        return self._sync("deposits", coin or "*", fetch, "orderId")
+
+    def sync_withdrawals(self, coin: Optional[str] = None) -> int:
+        """
+        Fetches new withdrawal records.
+
+        Args:
+        - coin (str, optional): Coin name. Defaults to all coins.
+
+        Returns:
+        - int: Number of records fetched.
+        """
+        def fetch(start, end, cursor):
+            return self.client.get_withdrawal_records(
+                str(start), str(end), coin=coin,
+                id_less_than=cursor, limit=self.PAGE_LIMIT
+            )
+        return self._sync("withdrawals", coin or "*", fetch, "orderId")
+
+    def sync_transfers(self, coin: str, from_type: str) -> int:
+        """
+        Fetches new transfer records.
+
+        Args:
+        - coin (str): Coin name.
+        - from_type (str): Account type transferred from.
+
+        Returns:
+        - int: Number of records fetched.
+        """
+        def fetch(start, end, cursor):
+            return self.client.get_transfer_records(
+                coin, from_type, start_time=str(start), end_time=str(end),
+                limit=self.PAGE_LIMIT, id_less_than=cursor
+            )
+        return self._sync(
+            "transfers", f"{coin}:{from_type}", fetch, "transferId"
+        )
+
+    def deposits(self, coin=None, start_time=None,
+                 end_time=None, status=None) -> List[dict]:
+        """
+        Returns stored deposit records, oldest first.
+        """
+        return self._query("deposits", coin, start_time, end_time, status)
+
+    def withdrawals(self, coin=None, start_time=None,
+                    end_time=None, status=None) -> List[dict]:
+        """
+        Returns stored withdrawal records, oldest first.
+        """
+        return self._query(
+            "withdrawals", coin, start_time, end_time, status
+        )
+
+    def transfers(self, coin=None, start_time=None,
+                  end_time=None, status=None) -> List[dict]:
+        """
+        Returns stored transfer records, oldest first.
+        """
+        return self._query("transfers", coin, start_time, end_time, status)
+
+    def _sync(self, kind: str, scope: str,
+              fetch: Callable, cursor_field: str) -> int:
+        row = self.conn.execute(
+            "SELECT last_time FROM sync_state WHERE kind = ? AND scope = ?",
+            (kind, scope)
+        ).fetchone()
+        last_time = row["last_time"] if row else None
+        start = (
+            max(self.since, last_time - self.lookback_ms)
+            if last_time is not None else self.since
+        )
+        now = int(time.time() * 1000)
+
+        fetched = 0
+        while start < now:
+            end = min(start + self.window_ms, now)
+            cursor = None
+            while True:
+                records = response_data(fetch(start, end, cursor)) or []
+                if records:
+                    self._upsert(kind, records)
+                    fetched += len(records)
+                    newest = max(
+                        int(r[_TABLES[kind][1]["c_time"]]) for r in records
+                    )
+                    last_time = max(newest, last_time or newest)
+                if len(records) < self.PAGE_LIMIT:
+                    break
+                cursor = records[-1][cursor_field]
+            start = end
+
+        if last_time is not None:
+            self.conn.execute(
+                "INSERT INTO sync_state (kind, scope, last_time) "
+                "VALUES (?, ?, ?) ON CONFLICT (kind, scope) "
+                "DO UPDATE SET last_time = excluded.last_time",
+                (kind, scope, last_time)
+            )
+        self.conn.commit()
+        return fetched
+
+    def _upsert(self, kind: str, records: List[dict]) -> None:
+        key, fields = _TABLES[kind]
+        columns = list(fields) + ["raw"]
+        updates = ", ".join(
+            f"{c} = excluded.{c}" for c in columns if c != key
+        )
+        sql = (
+            f"INSERT INTO {kind} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))}) "
+            f"ON CONFLICT ({key}) DO UPDATE SET {updates}"
+        )
+        self.conn.executemany(sql, [
+            [record.get(field) for field in fields.values()]
+            + [json.dumps(record)]
+            for record in records
+        ])
+
+    def _query(self, kind, coin, start_time, end_time, status) -> List[dict]:
+        clauses, args = [], []
+        if coin:
+            clauses.append("coin = ?")
+            args.append(coin)
+        if start_time is not None:
+            clauses.append("c_time >= ?")
+            args.append(int(start_time))
+        if end_time is not None:
+            clauses.append("c_time <= ?")
+            args.append(int(end_time))
+        if status:
+            clauses.append("status = ?")
+            args.append(status)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        rows = self.conn.execute(
+            f"SELECT raw FROM {kind}{where} ORDER BY c_time", args
+        )
+        return [json.loads(row["raw"]) for row in rows]
@@ -0,0 +1,161 @@
+import threading
+from collections import deque
+from typing import Dict, Optional
+"""
+Per-endpoint request metrics
+"""
+
+
+class EndpointStats:
+    """
+    Counters and recent latencies of one endpoint.
+
+    Fields:
+    - requests: Requests sent (including hedges).
+    - errors: Requests that raised or returned HTTP >= 500.
+    - timeouts: Requests that hit a timeout or deadline.
+    - hedges: Hedge requests sent.
+    - hedge_wins: Hedge requests that answered first.
+    - rejected: Requests refused by an open circuit breaker.
+    - circuit: Circuit breaker state ("closed", "open", "half_open").
+    - latencies: The most recent latencies in seconds.
+    - samples: Latencies recorded so far.
+    - ordered: Sorted copy of latencies taken at `ordered_at` samples.
+    """
+
+    def __init__(self, window: int) -> None:
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.rejected = 0
+        self.circuit = "closed"
+        self.latencies = deque(maxlen=window)
+        self.samples = 0
+        self.ordered = None
+        self.ordered_at = 0
+
+
+class RequestMetrics:
+    """
+    Thread-safe collection of EndpointStats.
+
+    Each endpoint has its own lock, so threads calling different
+    endpoints never contend on the metrics.
+
+    Methods:
+    - __init__(self, window=1000) -> None
+    - observe(endpoint, seconds, error=False, timeout=False) -> None
+    - percentile(endpoint, q, min_samples=1) -> Optional[float]
+    - increment(endpoint, counter) -> None
+    - set_circuit(endpoint, state) -> None
+    - snapshot() -> dict
+    """
+
+    def __init__(self, window: int = 1000, refresh: int = 50) -> None:
+        """
+        Initializes the RequestMetrics instance.
+
+        Args:
+        - window (int, optional): Latencies kept per endpoint.
+            Defaults to 1000.
+        - refresh (int, optional): New latencies after which
+            percentiles are computed again. Defaults to 50.
+        """
+        self.window = window
+        self.refresh = refresh
+        self._stats: Dict[str, EndpointStats] = {}
+
+    def _get(self, endpoint: str) -> EndpointStats:
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            # setdefault is atomic, so racing threads share one entry
+            stats = self._stats.setdefault(
+                endpoint, EndpointStats(self.window)
+            )
+        return stats
+
+    def observe(self, endpoint: str, seconds: float,
+                error: bool = False, timeout: bool = False) -> None:
+        """
+        Records one finished request.
+        """
+        stats = self._get(endpoint)
+        with stats.lock:
+            stats.requests += 1
+            if timeout:
+                stats.timeouts += 1
+            elif error:
+                stats.errors += 1
+            else:
+                stats.latencies.append(seconds)
+                stats.samples += 1
+
+    def increment(self, endpoint: str, counter: str) -> None:
+        """
+        Increments a counter, e.g. "hedges" or "hedge_wins".
+        """
+        stats = self._get(endpoint)
+        with stats.lock:
+            setattr(stats, counter, getattr(stats, counter) + 1)
+
+    def set_circuit(self, endpoint: str, state: str) -> None:
+        """
+        Records the circuit breaker state of an endpoint.
+        """
+        self._get(endpoint).circuit = state
+
+    def percentile(self, endpoint: str, q: float,
+                   min_samples: int = 1) -> Optional[float]:
+        """
+        Returns the q-th percentile (0-100) of recent latencies.
+
+        The sorted latencies are reused until `refresh` new ones have
+        been recorded, so this is cheap enough to call per request.
+
+        Returns:
+        - float: Latency in seconds, or None with fewer than
+            min_samples successful requests.
+        """
+        stats = self._stats.get(endpoint)
+        if stats is None:
+            return None
+        min_samples = max(min_samples, 1)
+        ordered = stats.ordered
+        new = stats.samples - stats.ordered_at
+        if (ordered is None or new >= self.refresh
+                or (new and len(ordered) < min_samples)):
+            with stats.lock:
+                latencies = list(stats.latencies)
+                samples = stats.samples
+            ordered = sorted(latencies)
+            stats.ordered = ordered
+            stats.ordered_at = samples
+        if len(ordered) < min_samples:
+            return None
+        index = min(len(ordered) - 1, int(len(ordered) * q / 100))
+        return ordered[index]
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Returns counters, circuit state and p50/p90/p99 latency
+        per endpoint.
+        """
+        result = {}
+        for endpoint, stats in list(self._stats.items()):
+            with stats.lock:
+                row = {
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    "timeouts": stats.timeouts,
+                    "hedges": stats.hedges,
+                    "hedge_wins": stats.hedge_wins,
+                    "rejected": stats.rejected,
+                    "circuit": stats.circuit,
+                }
+            for q in (50, 90, 99):
+                row[f"p{q}"] = self.percentile(endpoint, q)
+            result[endpoint] = row
+        return result
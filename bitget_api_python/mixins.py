@@ -1,5 +1,9 @@
-from typing import Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
 from requests import Response
+from .exceptions import BitgetAPIError, CircuitOpenError
+from .utils import response_data
 """
 Basic building blocks for Clients classes
 """
@@ -17,7 +21,7 @@ class MarketMixin:
         - get_candlestick_data -> Response
     """
 
-    def get_symbol_info(self, symbol: Optional[str] = None) -> Response:
+    def get_symbol_info(self, symbol: Optional[str] = None, stream: bool = False) -> Response:
         """
         Get spot trading pair information, supporting both individual and full queries.
 
@@ -29,6 +33,8 @@ class MarketMixin:
         Parameters:
             - symbol (str, optional): Trading pair name, e.g. BTCUSDT.
               If omitted, returns information for all trading pairs.
+            - stream (bool, optional): Leave the body unread, so the full list
+              can be consumed item by item with iter_data(). Default is False.
 
         Returns:
             A dictionary with trading pair information.
@@ -65,7 +71,7 @@ class MarketMixin:
         if symbol:
             params["symbol"] = symbol
 
-        return self.get(endpoint, params=params)
+        return self.get(endpoint, params=params, stream=stream)
 
     def get_ticker_info(self, symbol: Optional[str] = None) -> Response:
         """
@@ -164,7 +170,13 @@ class MarketMixin:
         params = {"symbol": symbol, "precision": precision, "limit": limit}
         return self.get(endpoint, params=params)
 
-    def get_orderbook_depth(self, symbol: str, type: str = "step0", limit: str = "150") -> Response:
+    def get_orderbook_depth(
+        self,
+        symbol: str,
+        type: str = "step0",
+        limit: str = "150",
+        stream: bool = False
+    ) -> Response:
         """
         Get order book depth.
 
@@ -179,6 +191,8 @@ class MarketMixin:
               Options: step0, step1, step2, step3, step4, step5.
             - limit (str, optional): Number of entries to return.
               Default is "150" (maximum 150).
+            - stream (bool, optional): Leave the body unread, so it can be
+              consumed with iter_data(). Default is False.
 
         Returns:
             A dictionary with order book depth data.
@@ -203,7 +217,7 @@ class MarketMixin:
         """
         endpoint = "/api/v2/spot/market/orderbook"
         params = {"symbol": symbol, "type": type, "limit": limit}
-        return self.get(endpoint, params=params)
+        return self.get(endpoint, params=params, stream=stream)
 
     def get_candlestick_data(
         self,
@@ -398,7 +412,8 @@ class MarketMixin:
         limit: str = "500",
         idLessThan: Optional[str] = None,
         startTime: Optional[str] = None,
-        endTime: Optional[str] = None
+        endTime: Optional[str] = None,
+        stream: bool = False
     ) -> Response:
         """
         Get market trades.
@@ -415,6 +430,8 @@ class MarketMixin:
             startTime (str, optional): Start time (Unix millisecond timestamp, e.g. "1690196141868").
             endTime (str, optional): End time (Unix millisecond timestamp, e.g. "1690196141868"). 
                                     startTime and endTime should be within 7 days.
+            stream (bool, optional): Leave the body unread, so trades can be
+                                    consumed one by one with iter_data(). Default is False.
 
         Returns:
             dict: A dictionary containing market trades data.
@@ -463,7 +480,7 @@ class MarketMixin:
         if endTime:
             params["endTime"] = endTime
 
-        return self.get(endpoint, params=params)
+        return self.get(endpoint, params=params, stream=stream)
 
 
 class AccountMixin:
@@ -740,7 +757,7 @@ class AccountMixin:
         if client_oid:
             data["clientOid"] = client_oid
 
-        return self.post(endpoint, data=data)
+        return self.post(endpoint, body=data)
 
     def get_deposit_address(
         self,
@@ -872,3 +889,478 @@ class AccountMixin:
             params["orderId"] = order_id
 
         return self.get(endpoint, params=params)
+
+
+class TradeMixin:
+    """
+    Trade methods
+
+    Methods:
+        - place_order -> Response
+        - cancel_order -> Response
+        - batch_orders -> Response
+        - batch_cancel_orders -> Response
+        - cancel_symbol_orders -> Response
+        - get_order_info -> Response
+        - get_unfilled_orders -> Response
+        - get_history_orders -> Response
+        - get_fills -> Response
+        - place_orders -> Dict[str, dict]
+        - cancel_orders -> Dict[str, dict]
+    """
+
+    BATCH_LIMIT = 50
+
+    def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        size: str,
+        price: Optional[str] = None,
+        force: str = "gtc",
+        client_oid: Optional[str] = None
+    ) -> Response:
+        """
+        Place an order.
+
+        docs:
+            - https://www.bitget.com/api-doc/spot/trade/Place-Order
+
+        HTTP Request:
+        POST /api/v2/spot/trade/place-order
+
+        Parameters:
+        - symbol (str): Trading pair, e.g. BTCUSDT.
+        - side (str): Order direction, buy or sell.
+        - order_type (str): limit or market.
+        - size (str): Amount; in quote coin for market buy orders.
+        - price (str, optional): Limit price, required for limit orders.
+        - force (str, optional): Execution strategy for limit orders:
+            gtc, post_only, fok or ioc. Default is "gtc".
+        - client_oid (str, optional): Custom order ID.
+
+        Returns:
+        A dictionary with orderId and clientOid.
+        """
+        endpoint = "/api/v2/spot/trade/place-order"
+        data = {
+            "symbol": symbol,
+            "side": side,
+            "orderType": order_type,
+            "force": force,
+            "size": size,
+        }
+        if price:
+            data["price"] = price
+        if client_oid:
+            data["clientOid"] = client_oid
+
+        return self.post(endpoint, body=data)
+
+    def cancel_order(
+        self,
+        symbol: str,
+        order_id: Optional[str] = None,
+        client_oid: Optional[str] = None
+    ) -> Response:
+        """
+        Cancel an order.
+
+        docs:
+            - https://www.bitget.com/api-doc/spot/trade/Cancel-Order
+
+        HTTP Request:
+        POST /api/v2/spot/trade/cancel-order
+
+        Parameters:
+        - symbol (str): Trading pair, e.g. BTCUSDT.
+        - order_id (str, optional): Order ID. Either order_id or
+            client_oid is required.
+        - client_oid (str, optional): Custom order ID.
+
+        Returns:
+        A dictionary with orderId and clientOid.
+        """
+        endpoint = "/api/v2/spot/trade/cancel-order"
+        data = {"symbol": symbol}
+        if order_id:
+            data["orderId"] = order_id
+        if client_oid:
+            data["clientOid"] = client_oid
+
+        return self.post(endpoint, body=data)
+
+    def batch_orders(self, symbol: str, order_list: List[dict]) -> Response:
+        """
+        Place up to 50 orders in one request.
+
+        docs:
+            - https://www.bitget.com/api-doc/spot/trade/Batch-Place-Orders
+
+        HTTP Request:
+        POST /api/v2/spot/trade/batch-orders
+
+        Parameters:
+        - symbol (str): Trading pair, e.g. BTCUSDT.
+        - order_list (list): Orders as dictionaries with the fields of
+            place-order: side, orderType, force, price, size, clientOid.
+
+        Returns:
+        A dictionary with successList and failureList, each item
+        carrying orderId and clientOid (plus errorMsg on failure).
+        """
+        endpoint = "/api/v2/spot/trade/batch-orders"
+        data = {"symbol": symbol, "orderList": order_list}
+        return self.post(endpoint, body=data)
+
+    def batch_cancel_orders(
+        self,
+        symbol: str,
+        order_list: List[dict]
+    ) -> Response:
+        """
+        Cancel up to 50 orders in one request.
+
+        docs:
+            - https://www.bitget.com/api-doc/spot/trade/Batch-Cancel-Orders
+
+        HTTP Request:
+        POST /api/v2/spot/trade/batch-cancel-order
+
+        Parameters:
+        - symbol (str): Trading pair, e.g. BTCUSDT.
+        - order_list (list): Dictionaries with orderId or clientOid.
+
+        Returns:
+        A dictionary with successList and failureList.
+        """
+        endpoint = "/api/v2/spot/trade/batch-cancel-order"
+        data = {"symbol": symbol, "orderList": order_list}
+        return self.post(endpoint, body=data)
+
+    def cancel_symbol_orders(self, symbol: str) -> Response:
+        """
+        Cancel all open orders of a trading pair.
+
+        docs:
+            - https://www.bitget.com/api-doc/spot/trade/Cancel-Symbol-Orders
+
+        HTTP Request:
+        POST /api/v2/spot/trade/cancel-symbol-order
+
+        Parameters:
+        - symbol (str): Trading pair, e.g. BTCUSDT.
+
+        Returns:
+        A dictionary with the symbol.
+        """
+        endpoint = "/api/v2/spot/trade/cancel-symbol-order"
+        return self.post(endpoint, body={"symbol": symbol})
+
+    def get_order_info(
+        self,
+        order_id: Optional[str] = None,
+        client_oid: Optional[str] = None
+    ) -> Response:
+        """
+        Get order details.
+
+        docs:
+            - https://www.bitget.com/api-doc/spot/trade/Get-Order-Info
+
+        HTTP Request:
+        GET /api/v2/spot/trade/orderInfo
+
+        Parameters:
+        - order_id (str, optional): Order ID. Either order_id or
+            client_oid is required.
+        - client_oid (str, optional): Custom order ID.
+
+        Returns:
+        A list with the order details.
+        """
+        endpoint = "/api/v2/spot/trade/orderInfo"
+        params = {}
+        if order_id:
+            params["orderId"] = order_id
+        if client_oid:
+            params["clientOid"] = client_oid
+
+        return self.get(endpoint, params=params)
+
+    def get_unfilled_orders(
+        self,
+        symbol: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        id_less_than: Optional[str] = None,
+        limit: int = 100,
+        order_id: Optional[str] = None
+    ) -> Response:
+        """
+        Get current open orders.
+
+        docs:
+            - https://www.bitget.com/api-doc/spot/trade/Get-Unfilled-Orders
+
+        HTTP Request:
+        GET /api/v2/spot/trade/unfilled-orders
+
+        Parameters:
+        - symbol (str, optional): Trading pair, e.g. BTCUSDT.
+        - start_time (str, optional): Start time (Unix ms).
+        - end_time (str, optional): End time (Unix ms).
+        - id_less_than (str, optional):
+            Requests the content on the page before this ID (older data).
+        - limit (int, optional):
+            Number of results returned. Default is 100, maximum is 100.
+        - order_id (str, optional): Order ID.
+
+        Returns:
+        A list of open orders.
+        """
+        endpoint = "/api/v2/spot/trade/unfilled-orders"
+        params = {}
+        if symbol:
+            params["symbol"] = symbol
+        if start_time:
+            params["startTime"] = start_time
+        if end_time:
+            params["endTime"] = end_time
+        if id_less_than:
+            params["idLessThan"] = id_less_than
+        if limit:
+            params["limit"] = limit
+        if order_id:
+            params["orderId"] = order_id
+
+        return self.get(endpoint, params=params)
+
+    def get_history_orders(
+        self,
+        symbol: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        id_less_than: Optional[str] = None,
+        limit: int = 100,
+        order_id: Optional[str] = None
+    ) -> Response:
+        """
+        Get filled and cancelled orders of the last 90 days.
+
+        docs:
+            - https://www.bitget.com/api-doc/spot/trade/Get-History-Orders
+
+        HTTP Request:
+        GET /api/v2/spot/trade/history-orders
+
+        Parameters:
+        - symbol (str, optional): Trading pair, e.g. BTCUSDT.
+        - start_time (str, optional): Start time (Unix ms).
+        - end_time (str, optional): End time (Unix ms).
+        - id_less_than (str, optional):
+            Requests the content on the page before this ID (older data).
+        - limit (int, optional):
+            Number of results returned. Default is 100, maximum is 100.
+        - order_id (str, optional): Order ID.
+
+        Returns:
+        A list of orders.
+        """
+        endpoint = "/api/v2/spot/trade/history-orders"
+        params = {}
+        if symbol:
+            params["symbol"] = symbol
+        if start_time:
+            params["startTime"] = start_time
+        if end_time:
+            params["endTime"] = end_time
+        if id_less_than:
+            params["idLessThan"] = id_less_than
+        if limit:
+            params["limit"] = limit
+        if order_id:
+            params["orderId"] = order_id
+
+        return self.get(endpoint, params=params)
+
+    def get_fills(
+        self,
+        symbol: str,
+        order_id: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        limit: int = 100,
+        id_less_than: Optional[str] = None
+    ) -> Response:
+        """
+        Get own trade fills.
+
+        docs:
+            - https://www.bitget.com/api-doc/spot/trade/Get-Fills
+
+        HTTP Request:
+        GET /api/v2/spot/trade/fills
+
+        Parameters:
+        - symbol (str): Trading pair, e.g. BTCUSDT.
+        - order_id (str, optional): Order ID.
+        - start_time (str, optional): Start time (Unix ms).
+        - end_time (str, optional): End time (Unix ms).
+        - limit (int, optional):
+            Number of results returned. Default is 100, maximum is 100.
+        - id_less_than (str, optional):
+            Requests the content on the page before this ID (older data).
+
+        Returns:
+        A list of fills.
+        """
+        endpoint = "/api/v2/spot/trade/fills"
+        params = {"symbol": symbol}
+        if order_id:
+            params["orderId"] = order_id
+        if start_time:
+            params["startTime"] = start_time
+        if end_time:
+            params["endTime"] = end_time
+        if limit:
+            params["limit"] = limit
+        if id_less_than:
+            params["idLessThan"] = id_less_than
+
+        return self.get(endpoint, params=params)
+
+    def place_orders(
+        self,
+        symbol: str,
+        orders: List[dict],
+        max_workers: int = 4
+    ) -> Dict[str, dict]:
+        """
+        Place any number of orders through the batch endpoint.
+
+        Orders are split into chunks of BATCH_LIMIT and the chunks are
+        submitted concurrently (each request still waits on the client's
+        rate limiter). Orders without a clientOid get a generated one.
+
+        Parameters:
+        - symbol (str): Trading pair, e.g. BTCUSDT.
+        - orders (list): Orders in the batch_orders format.
+        - max_workers (int, optional): Concurrent batch requests.
+            Default is 4.
+
+        Returns:
+        A dictionary keyed by clientOid, in input order, with
+        "success", "orderId" and, on failure, "errorMsg".
+        "success" is None when the request of a chunk failed in transit
+        (timeout, deadline, connection error, HTTP 5xx): the exchange
+        may have placed those orders. Reconcile them with
+        get_order_info(client_oid=...) before submitting them again;
+        the "error" field holds the exception.
+        """
+        orders = [
+            order if order.get("clientOid")
+            else dict(order, clientOid=uuid.uuid4().hex)
+            for order in orders
+        ]
+        return self._run_batches(
+            self.batch_orders, symbol, orders, "clientOid", max_workers
+        )
+
+    def cancel_orders(
+        self,
+        symbol: str,
+        orders: List[dict],
+        max_workers: int = 4
+    ) -> Dict[str, dict]:
+        """
+        Cancel any number of orders through the batch endpoint.
+
+        Parameters:
+        - symbol (str): Trading pair, e.g. BTCUSDT.
+        - orders (list): Dictionaries with orderId or clientOid.
+        - max_workers (int, optional): Concurrent batch requests.
+            Default is 4.
+
+        Returns:
+        A dictionary keyed by clientOid (orderId when no clientOid was
+        given) with "success", "orderId" and, on failure, "errorMsg".
+        "success" is None when the outcome is unknown, as in
+        place_orders.
+        """
+        return self._run_batches(
+            self.batch_cancel_orders, symbol, orders, None, max_workers
+        )
+
+    def _run_batches(
+        self,
+        submit: Callable[[str, List[dict]], Response],
+        symbol: str,
+        orders: List[dict],
+        key_field: Optional[str],
+        max_workers: int
+    ) -> Dict[str, dict]:
+        def key(item: dict) -> str:
+            if key_field:
+                return item.get(key_field)
+            return item.get("clientOid") or item.get("orderId")
+
+        def match(order: dict, results: Dict[tuple, dict]) -> Optional[dict]:
+            # Results echo clientOid even for orders given by orderId,
+            # so an order is matched on the ID it was submitted with.
+            if order.get("clientOid"):
+                return results.get(("clientOid", order["clientOid"]))
+            return results.get(("orderId", order.get("orderId")))
+
+        def run(chunk: List[dict]) -> Dict[tuple, dict]:
+            try:
+                data = response_data(submit(symbol, chunk)) or {}
+            except Exception as exc:
+                # Only a definite rejection means nothing was executed;
+                # after a timeout or 5xx the orders may exist.
+                rejected = isinstance(exc, CircuitOpenError) or (
+                    isinstance(exc, BitgetAPIError)
+                    and exc.status_code < 500
+                )
+                return {
+                    ("order", id(order)): {
+                        "success": False if rejected else None,
+                        "orderId": order.get("orderId"),
+                        "clientOid": order.get("clientOid"),
+                        "errorMsg": str(exc),
+                        "error": exc,
+                    }
+                    for order in chunk
+                }
+            results = {}
+            for success, items in ((True, data.get("successList")),
+                                   (False, data.get("failureList"))):
+                for item in items or []:
+                    result = dict(item, success=success)
+                    for field in ("clientOid", "orderId"):
+                        if item.get(field):
+                            results[(field, item[field])] = result
+            return results
+
+        chunks = [
+            orders[i:i + self.BATCH_LIMIT]
+            for i in range(0, len(orders), self.BATCH_LIMIT)
+        ]
+        merged: Dict[tuple, dict] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for results in executor.map(run, chunks):
+                merged.update(results)
+        return {
+            key(order): (
+                merged.get(("order", id(order)))
+                or match(order, merged)
+                or {
+                    "success": False,
+                    "orderId": order.get("orderId"),
+                    "clientOid": order.get("clientOid"),
+                    "errorMsg": "missing from batch response",
+                }
+            )
+            for order in orders
+        }
@@ -0,0 +1,334 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+from .utils import response_data
+"""
+Adaptive polling of market data endpoints
+"""
+
+TICKER = "ticker"
+TRADES = "trades"
+DEPTH = "depth"
+
+# Client method polled for each kind of feed
+METHODS = {
+    TICKER: "get_ticker_info",
+    TRADES: "get_recent_trades",
+    DEPTH: "get_orderbook_depth",
+}
+
+# Fields that change on every response and are ignored when deciding
+# whether the data changed.
+VOLATILE_FIELDS = ("ts", "requestTime")
+
+
+def _strip(data):
+    if isinstance(data, dict):
+        return {
+            key: value for key, value in data.items()
+            if key not in VOLATILE_FIELDS
+        }
+    if isinstance(data, list):
+        return [_strip(item) for item in data]
+    return data
+
+
+class PollUpdate:
+    """
+    New data of one feed.
+
+    Fields:
+    - kind: "ticker", "trades" or "depth".
+    - symbol: Trading pair, e.g. BTCUSDT.
+    - data: The "data" field of the response.
+    - received_at: Unix time in ms when the response arrived.
+    """
+
+    def __init__(self, kind: str, symbol: str, data,
+                 received_at: int) -> None:
+        self.kind = kind
+        self.symbol = symbol
+        self.data = data
+        self.received_at = received_at
+
+
+class _Feed:
+    def __init__(self, kind: str, symbol: str, interval: float) -> None:
+        self.kind = kind
+        self.symbol = symbol
+        self.interval = interval
+        self.callbacks: List[Callable[[PollUpdate], None]] = []
+        self.last = None
+        self.last_update: Optional[PollUpdate] = None
+        self.due = 0.0
+        self.busy = False
+        self.polls = 0
+        self.changes = 0
+        self.errors = 0
+
+
+class AdaptivePoller:
+    """
+    Polls tickers, recent trades and order books with a separate
+    interval per feed.
+
+    A feed whose data changed since its last poll is polled sooner
+    (interval * speedup), an unchanged one later (interval * slowdown),
+    within [min_interval, max_interval]. When the feeds together would
+    need more than `rate` requests per second, all intervals are
+    stretched by the same factor to stay within the budget.
+
+    Unchanged responses (ignoring timestamps) are not delivered.
+    Updates go to callbacks, called from the poller's worker threads,
+    or to async iterators from updates().
+
+    Methods:
+    - __init__(self, client, rate=5.0, ...) -> None
+    - subscribe(kind, symbol, callback) -> None
+    - unsubscribe(kind, symbol, callback) -> None
+    - updates(kind, symbol, maxsize=100) -> AsyncIterator[PollUpdate]
+    - poll_once(kind, symbol) -> Optional[PollUpdate]
+    - start() -> None
+    - stop() -> None
+    - stats() -> dict
+
+    Fields:
+    - rate: Requests per second available to the poller.
+    """
+
+    def __init__(
+        self,
+        client,
+        rate: float = 5.0,
+        min_interval: float = 0.25,
+        max_interval: float = 30.0,
+        speedup: float = 0.5,
+        slowdown: float = 1.5,
+        max_workers: int = 4
+    ) -> None:
+        """
+        Initializes the AdaptivePoller instance.
+
+        Args:
+        - client (Client): Client used for the requests.
+        - rate (float, optional): Requests per second the poller may
+            use, i.e. what is left of the rate limit after other
+            traffic. Defaults to 5.0.
+        - min_interval (float, optional): Shortest interval per feed in
+            seconds. Defaults to 0.25.
+        - max_interval (float, optional): Longest interval per feed in
+            seconds. Defaults to 30.0.
+        - speedup (float, optional): Interval factor after a change.
+            Defaults to 0.5.
+        - slowdown (float, optional): Interval factor after an
+            unchanged response or an error. Defaults to 1.5.
+        - max_workers (int, optional): Concurrent requests.
+            Defaults to 4.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("need 0 < min_interval <= max_interval")
+        self.client = client
+        self.rate = rate
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.speedup = speedup
+        self.slowdown = slowdown
+        self.max_workers = max_workers
+        self._feeds: Dict[Tuple[str, str], _Feed] = {}
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = None
+        self._executor = None
+
+    def _feed(self, kind: str, symbol: str) -> _Feed:
+        if kind not in METHODS:
+            raise ValueError(f"unknown feed kind {kind!r}")
+        feed = self._feeds.get((kind, symbol))
+        if feed is None:
+            feed = self._feeds[(kind, symbol)] = _Feed(
+                kind, symbol, self.min_interval
+            )
+        return feed
+
+    def subscribe(self, kind: str, symbol: str,
+                  callback: Callable[[PollUpdate], None]) -> None:
+        """
+        Calls `callback` with every change of a feed. A subscriber to
+        a feed that is already polled first gets its latest update.
+
+        Args:
+        - kind (str): "ticker", "trades" or "depth".
+        - symbol (str): Trading pair, e.g. BTCUSDT.
+        - callback (Callable): Receives a PollUpdate.
+        """
+        with self._cond:
+            feed = self._feed(kind, symbol)
+            feed.callbacks.append(callback)
+            last_update = feed.last_update
+            self._cond.notify()
+        if last_update is not None:
+            callback(last_update)
+
+    def unsubscribe(self, kind: str, symbol: str,
+                    callback: Callable[[PollUpdate], None]) -> None:
+        """
+        Removes a callback; the feed stops being polled when it has
+        no subscribers left.
+        """
+        with self._cond:
+            feed = self._feeds.get((kind, symbol))
+            if feed is None or callback not in feed.callbacks:
+                return
+            feed.callbacks.remove(callback)
+            if not feed.callbacks:
+                del self._feeds[(kind, symbol)]
+
+    async def updates(self, kind: str, symbol: str,
+                      maxsize: int = 100) -> AsyncIterator[PollUpdate]:
+        """
+        Yields the changes of a feed in the running event loop.
+
+        When the consumer falls more than maxsize updates behind, the
+        oldest queued update is dropped.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+
+        def offer(update: PollUpdate) -> None:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(update)
+
+        def callback(update: PollUpdate) -> None:
+            try:
+                loop.call_soon_threadsafe(offer, update)
+            except RuntimeError:
+                # The loop is closed
+                pass
+
+        self.subscribe(kind, symbol, callback)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.unsubscribe(kind, symbol, callback)
+
+    def _budget_factor(self) -> float:
+        demand = sum(1 / feed.interval for feed in self._feeds.values())
+        return max(1.0, demand / self.rate)
+
+    def poll_once(self, kind: str, symbol: str) -> Optional[PollUpdate]:
+        """
+        Polls one feed now, adapts its interval and delivers the
+        update if the data changed.
+
+        Returns:
+        - PollUpdate: The update, or None if nothing changed.
+        """
+        if kind not in METHODS:
+            raise ValueError(f"unknown feed kind {kind!r}")
+        response = getattr(self.client, METHODS[kind])(symbol)
+        data = response_data(response)
+        update = PollUpdate(kind, symbol, data, int(time.time() * 1000))
+        stripped = _strip(data)
+        with self._cond:
+            feed = self._feeds.get((kind, symbol))
+            if feed is None:
+                # Not subscribed (any more): nothing to compare against
+                return update
+            feed.polls += 1
+            if feed.last_update is not None and stripped == feed.last:
+                feed.interval = min(
+                    self.max_interval, feed.interval * self.slowdown
+                )
+                return None
+            feed.changes += 1
+            feed.interval = max(
+                self.min_interval, feed.interval * self.speedup
+            )
+            feed.last = stripped
+            feed.last_update = update
+            callbacks = list(feed.callbacks)
+        for callback in callbacks:
+            try:
+                callback(update)
+            except Exception:
+                # One failing subscriber must not stop the others
+                pass
+        return update
+
+    def _poll(self, feed: _Feed) -> None:
+        try:
+            self.poll_once(feed.kind, feed.symbol)
+        except Exception:
+            with self._cond:
+                feed.errors += 1
+                feed.interval = min(
+                    self.max_interval, feed.interval * self.slowdown
+                )
+        finally:
+            with self._cond:
+                feed.busy = False
+                feed.due = (
+                    time.monotonic()
+                    + feed.interval * self._budget_factor()
+                )
+                self._cond.notify()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            with self._cond:
+                now = time.monotonic()
+                idle = [
+                    feed for feed in self._feeds.values() if not feed.busy
+                ]
+                due = [feed for feed in idle if feed.due <= now]
+                if not due:
+                    wait = min((feed.due for feed in idle), default=now + 1)
+                    self._cond.wait(max(0.0, wait - now))
+                    continue
+                for feed in due:
+                    feed.busy = True
+            for feed in due:
+                self._executor.submit(self._poll, feed)
+
+    def start(self) -> None:
+        """
+        Starts polling in a background thread.
+        """
+        self._stop.clear()
+        self._executor = ThreadPoolExecutor(self.max_workers)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Returns interval, polls, changes and errors per feed, keyed
+        "kind:symbol". `effective_interval` includes the budget factor.
+        """
+        with self._cond:
+            factor = self._budget_factor()
+            return {
+                f"{feed.kind}:{feed.symbol}": {
+                    "interval": feed.interval,
+                    "effective_interval": feed.interval * factor,
+                    "polls": feed.polls,
+                    "changes": feed.changes,
+                    "errors": feed.errors,
+                }
+                for feed in self._feeds.values()
+            }
@@ -0,0 +1,159 @@
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+from .bitget_client import Client
+from .rate_limit import RateLimiter
+"""
+Many accounts behind one connection pool
+"""
+
+
+class ClientPool:
+    """
+    A set of Clients, one per account (UID), sharing one HTTP session.
+
+    All clients reuse the same keep-alive connections, the API is
+    pinged once for the whole pool, and every account gets its own
+    RateLimiter, matching Bitget's per-UID limits.
+
+    Methods:
+    - __init__(self, accounts, rate=10, max_workers=16, ...) -> None
+    - __getitem__(uid) -> Client
+    - map(func, uids=None, return_exceptions=False) -> dict
+    - call(method, *args, **kwargs) -> dict
+    - get_account_assets(coin=None, asset_type="hold_only") -> dict
+    - close() -> None
+
+    Fields:
+    - clients: Client per account UID.
+    - session: The shared requests.Session.
+    - is_connected: Result of the single ping.
+    """
+
+    clients: Dict[str, Client]
+    session: requests.Session
+    is_connected: bool
+
+    def __init__(
+        self,
+        accounts: Mapping[str, Mapping[str, str]],
+        rate: float = 10,
+        max_workers: int = 16,
+        session: Optional[requests.Session] = None,
+        client_class=Client
+    ) -> None:
+        """
+        Initializes the ClientPool instance.
+
+        Args:
+        - accounts (Mapping): Credentials per account UID, e.g.
+            {"1234567": {"api_key": ..., "api_secret": ...,
+                         "api_passphrase": ...}}.
+        - rate (float, optional): Requests per second allowed for each
+            account. Defaults to 10.
+        - max_workers (int, optional): Threads used to fan out calls.
+            Defaults to 16.
+        - session (requests.Session, optional): Shared session.
+            Defaults to a new session with a connection pool sized
+            for max_workers.
+        - client_class (type, optional): Client class to instantiate.
+            Defaults to Client.
+        """
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=4, pool_maxsize=max_workers
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
+        self.max_workers = max_workers
+        self.clients = {
+            uid: client_class(
+                credentials["api_key"],
+                credentials["api_secret"],
+                credentials["api_passphrase"],
+                rate_limiter=RateLimiter(rate),
+                session=session,
+                check_connection=False,
+            )
+            for uid, credentials in accounts.items()
+        }
+        self.is_connected = False
+        if self.clients:
+            self.is_connected = next(iter(self.clients.values())).ping()
+        for client in self.clients.values():
+            client.is_connected = self.is_connected
+
+    def __getitem__(self, uid: str) -> Client:
+        return self.clients[uid]
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def map(
+        self,
+        func: Callable[[Client], Any],
+        uids: Optional[Iterable[str]] = None,
+        return_exceptions: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Calls func(client) for every account concurrently.
+
+        Args:
+        - func (Callable): Function taking a Client.
+        - uids (Iterable[str], optional): Accounts to include.
+            Defaults to all accounts.
+        - return_exceptions (bool, optional): Return an exception raised
+            for one account as its result instead of raising it.
+            Defaults to False.
+
+        Returns:
+        - dict: Result per account UID.
+        """
+        uids = list(self.clients) if uids is None else list(uids)
+
+        def run(uid):
+            try:
+                return func(self.clients[uid])
+            except Exception as exc:
+                if return_exceptions:
+                    return exc
+                raise
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return dict(zip(uids, executor.map(run, uids)))
+
+    def call(self, method: str, *args, **kwargs) -> Dict[str, Any]:
+        """
+        Calls a Client method for every account concurrently.
+
+        Args:
+        - method (str): Client method name, e.g. "get_account_info".
+        - *args, **kwargs: Passed to the method.
+
+        Returns:
+        - dict: Response per account UID.
+        """
+        return self.map(
+            lambda client: getattr(client, method)(*args, **kwargs)
+        )
+
+    def get_account_assets(
+        self,
+        coin: Optional[str] = None,
+        asset_type: str = "hold_only"
+    ) -> Dict[str, Any]:
+        """
+        Get account assets of every account.
+
+        Returns:
+        - dict: Response per account UID.
+        """
+        return self.call(
+            "get_account_assets", coin=coin, asset_type=asset_type
+        )
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,200 @@
+import math
+from array import array
+from decimal import ROUND_FLOOR, ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from .utils import response_data
+"""
+Order price and size rounding from symbol rules
+"""
+
+# Absorbs float noise such as 0.29 * 100 == 28.999999999999996 or
+# 677176.396 * 10000 == 6771763959.999999. The error of value * scale
+# is at most two rounding units (2 ** -53) of the product; allowing
+# four stays far below a tick for floats of up to 13 significant
+# digits. Pass strings for longer values.
+_RELATIVE_EPSILON = 4 * 2.0 ** -53
+# Tolerance of the minimum amount and value checks
+_EPSILON = 1e-9
+
+
+def _exact_ticks(text: str, precision: int, rounding: str) -> int:
+    # Decimal strings are converted without going through float
+    try:
+        ticks = Decimal(text).scaleb(precision).to_integral_value(rounding)
+    except InvalidOperation:
+        raise ValueError(f"invalid number {text!r}") from None
+    return int(ticks)
+
+
+def _format(ticks: int, precision: int) -> str:
+    if precision <= 0:
+        return str(ticks)
+    sign = "-" if ticks < 0 else ""
+    digits = str(abs(ticks)).rjust(precision + 1, "0")
+    return f"{sign}{digits[:-precision]}.{digits[-precision:]}"
+
+
+class QuantizerTable:
+    """
+    Per-symbol trading rules in flat arrays, built once from
+    get_symbol_info().
+
+    Prices are rounded to the nearest tick (halves up) and sizes down
+    to the quantity step, using integer tick counts so the formatted
+    strings are exact. String inputs are converted exactly; float
+    inputs with a relative tolerance, so values that already are on
+    the grid are returned unchanged. Whole batches are checked
+    against minTradeAmount, maxTradeAmount, minTradeUSDT and the
+    symbol status in one pass.
+
+    Methods:
+    - __init__(self, symbols) -> None
+    - from_client(client) -> QuantizerTable
+    - quantize(symbol, price, size) -> tuple
+    - quantize_batch(symbols, prices, sizes) -> tuple
+
+    Fields:
+    - index: Row of each symbol in the arrays.
+    """
+
+    def __init__(self, symbols: Iterable[dict]) -> None:
+        """
+        Initializes the QuantizerTable instance.
+
+        Args:
+        - symbols (Iterable[dict]): The "data" items of
+            get_symbol_info().
+        """
+        self.index: Dict[str, int] = {}
+        self.price_precision = array("b")
+        self.quantity_precision = array("b")
+        self.price_scale = array("d")
+        self.quantity_scale = array("d")
+        self.min_amount = array("d")
+        self.max_amount = array("d")
+        self.min_usdt = array("d")
+        self.checks_usdt = array("b")
+        self.online = array("b")
+        for row in symbols:
+            price_precision = int(row.get("pricePrecision") or 0)
+            quantity_precision = int(row.get("quantityPrecision") or 0)
+            self.index[row["symbol"]] = len(self.price_precision)
+            self.price_precision.append(price_precision)
+            self.quantity_precision.append(quantity_precision)
+            self.price_scale.append(10.0 ** price_precision)
+            self.quantity_scale.append(10.0 ** quantity_precision)
+            self.min_amount.append(float(row.get("minTradeAmount") or 0))
+            self.max_amount.append(
+                float(row.get("maxTradeAmount") or 0) or math.inf
+            )
+            self.min_usdt.append(float(row.get("minTradeUSDT") or 0))
+            self.checks_usdt.append(row.get("quoteCoin") == "USDT")
+            self.online.append(row.get("status", "online") == "online")
+
+    @classmethod
+    def from_client(cls, client) -> "QuantizerTable":
+        """
+        Builds the table from a single get_symbol_info() call.
+        """
+        return cls(response_data(client.get_symbol_info()))
+
+    def quantize(self, symbol: str, price, size) -> Tuple[str, str,
+                                                          Optional[str]]:
+        """
+        Rounds one order.
+
+        Args:
+        - symbol (str): Trading pair, e.g. BTCUSDT.
+        - price (float or str): Limit price.
+        - size (float or str): Order size in base coin.
+
+        Returns:
+        - tuple: (price, size, error); error is None for a valid order.
+        """
+        prices, sizes, errors = self.quantize_batch(
+            [symbol], [price], [size]
+        )
+        return prices[0], sizes[0], errors[0]
+
+    def quantize_batch(
+        self,
+        symbols: Sequence[str],
+        prices: Sequence,
+        sizes: Sequence
+    ) -> Tuple[List[str], List[str], List[Optional[str]]]:
+        """
+        Rounds and validates a batch of orders.
+
+        Args:
+        - symbols (Sequence[str]): Trading pair of each order.
+        - prices (Sequence): Limit price of each order.
+        - sizes (Sequence): Size of each order in base coin.
+
+        Returns:
+        - tuple: Lists of rounded prices, rounded sizes and errors
+            (None for valid orders).
+        """
+        index = self.index
+        price_precision = self.price_precision
+        quantity_precision = self.quantity_precision
+        price_scale = self.price_scale
+        quantity_scale = self.quantity_scale
+        min_amount = self.min_amount
+        max_amount = self.max_amount
+        min_usdt = self.min_usdt
+        checks_usdt = self.checks_usdt
+        online = self.online
+        floor = math.floor
+
+        out_prices: List[str] = []
+        out_sizes: List[str] = []
+        errors: List[Optional[str]] = []
+        for symbol, price, size in zip(symbols, prices, sizes):
+            row = index.get(symbol)
+            if row is None:
+                out_prices.append("")
+                out_sizes.append("")
+                errors.append(f"unknown symbol {symbol}")
+                continue
+            if isinstance(price, str):
+                price_ticks = _exact_ticks(
+                    price, price_precision[row], ROUND_HALF_UP
+                )
+            else:
+                scaled = float(price) * price_scale[row]
+                price_ticks = floor(
+                    scaled + 0.5 + abs(scaled) * _RELATIVE_EPSILON
+                )
+            if isinstance(size, str):
+                size_ticks = _exact_ticks(
+                    size, quantity_precision[row], ROUND_FLOOR
+                )
+            else:
+                scaled = float(size) * quantity_scale[row]
+                size_ticks = floor(
+                    scaled + abs(scaled) * _RELATIVE_EPSILON
+                )
+            out_prices.append(_format(price_ticks, price_precision[row]))
+            out_sizes.append(_format(size_ticks, quantity_precision[row]))
+
+            rounded_price = price_ticks / price_scale[row]
+            rounded_size = size_ticks / quantity_scale[row]
+            if not online[row]:
+                errors.append(f"{symbol} is not online")
+            elif price_ticks <= 0 or size_ticks <= 0:
+                errors.append("price and size must be positive")
+            elif rounded_size < min_amount[row] - _EPSILON:
+                errors.append(
+                    f"size below minTradeAmount {min_amount[row]:g}"
+                )
+            elif rounded_size > max_amount[row]:
+                errors.append(
+                    f"size above maxTradeAmount {max_amount[row]:g}"
+                )
+            elif (checks_usdt[row]
+                    and rounded_price * rounded_size
+                    < min_usdt[row] - _EPSILON):
+                errors.append(f"value below minTradeUSDT {min_usdt[row]:g}")
+            else:
+                errors.append(None)
+        return out_prices, out_sizes, errors
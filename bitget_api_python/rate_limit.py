@@ -0,0 +1,149 @@
+import multiprocessing
+import threading
+import time
+from typing import Optional
+"""
+Client-side request rate limiting
+"""
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Bitget limits most endpoints per second, per UID (private endpoints)
+    or per IP (public endpoints). One limiter can be shared by every
+    client and thread that draws on the same budget.
+
+    Methods:
+    - __init__(self, rate, capacity=None) -> None
+    - acquire(tokens=1, priority=None, timeout=None) -> float
+
+    Fields:
+    - rate: Tokens added per second.
+    - capacity: Maximum burst size.
+    """
+
+    rate: float
+    capacity: float
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        """
+        Initializes the RateLimiter instance.
+
+        Args:
+        - rate (float): Requests allowed per second.
+        - capacity (float, optional): Burst size. Defaults to rate.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1, priority: Optional[str] = None,
+                timeout: Optional[float] = None) -> float:
+        """
+        Takes tokens from the bucket, sleeping until they are available.
+
+        The tokens are reserved under the lock and the caller sleeps
+        outside it, so waiting threads are served in arrival order
+        without holding each other up.
+
+        Args:
+        - tokens (float, optional): Cost of the request. Defaults to 1.
+        - priority (str, optional): Ignored; accepted so that limiters
+            and PriorityScheduler are interchangeable.
+        - timeout (float, optional): Longest acceptable wait in seconds.
+            Defaults to None (no limit).
+
+        Returns:
+        - float: Seconds spent waiting.
+
+        Raises:
+        - TimeoutError: If the wait would exceed timeout; no tokens
+            are taken.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            missing = tokens - self._tokens
+            wait = missing / self.rate if missing > 0 else 0.0
+            if timeout is not None and wait > timeout:
+                raise TimeoutError("rate limiter wait exceeds timeout")
+            self._tokens -= tokens
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class SharedRateLimiter:
+    """
+    Rate limiter shared by several processes.
+
+    Requests are spaced 1/rate seconds apart using a timestamp in
+    shared memory. Create it in the parent process and hand it to the
+    workers (e.g. through a ProcessPoolExecutor initializer).
+
+    Methods:
+    - __init__(self, rate, context=None) -> None
+    - acquire(tokens=1, priority=None, timeout=None) -> float
+
+    Fields:
+    - rate: Requests per second across all processes.
+    """
+
+    rate: float
+
+    def __init__(self, rate: float, context=None) -> None:
+        """
+        Initializes the SharedRateLimiter instance.
+
+        Args:
+        - rate (float): Requests allowed per second.
+        - context (multiprocessing context, optional): Context the
+            worker processes are started with. Defaults to the
+            default context.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        context = context or multiprocessing.get_context()
+        self.rate = rate
+        self._next = context.Value("d", 0.0, lock=False)
+        self._lock = context.Lock()
+
+    def acquire(self, tokens: float = 1, priority: Optional[str] = None,
+                timeout: Optional[float] = None) -> float:
+        """
+        Reserves the next free slot and sleeps until it starts.
+
+        Args:
+        - tokens (float, optional): Cost of the request. Defaults to 1.
+        - priority (str, optional): Ignored; accepted so that limiters
+            and PriorityScheduler are interchangeable.
+        - timeout (float, optional): Longest acceptable wait in seconds.
+            Defaults to None (no limit).
+
+        Returns:
+        - float: Seconds spent waiting.
+
+        Raises:
+        - TimeoutError: If the slot starts after timeout; nothing is
+            reserved.
+        """
+        with self._lock:
+            now = time.time()
+            start = max(now, self._next.value)
+            if timeout is not None and start - now > timeout:
+                raise TimeoutError("rate limiter wait exceeds timeout")
+            self._next.value = start + tokens / self.rate
+        wait = start - now
+        if wait > 0:
+            time.sleep(wait)
+        return wait
@@ -0,0 +1,188 @@
+import threading
+import time
+from typing import Dict, Optional
+"""
+Prioritised sharing of one request budget
+"""
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+# Endpoints used by backfills; scheduled as BULK unless the caller
+# chooses a priority with BitgetAuth.priority().
+BULK_ENDPOINTS = (
+    "/api/v2/spot/market/history-candles",
+    "/api/v2/spot/market/fills-history",
+    "/api/v2/spot/account/bills",
+)
+
+
+class PriorityScheduler:
+    """
+    Rate limiter that splits its budget between priority classes.
+
+    Every class has its own token bucket filled at its share of the
+    rate, so bulk work can never take the budget reserved for
+    interactive calls. Unused capacity is lent out: a class may take
+    tokens from a lower-priority class that has nobody waiting, and
+    from a higher-priority class that has nobody waiting as long as
+    that class keeps `reserve` of its burst for its next call.
+
+    It can be used wherever a RateLimiter is accepted.
+
+    Methods:
+    - __init__(self, rate, shares=None, default=INTERACTIVE, ...) -> None
+    - acquire(tokens=1, priority=None, timeout=None) -> float
+    - stats() -> dict
+
+    Fields:
+    - rate: Total requests per second.
+    - classes: Class names, highest priority first.
+    """
+
+    POLL_INTERVAL = 0.05
+
+    def __init__(
+        self,
+        rate: float,
+        shares: Optional[Dict[str, float]] = None,
+        default: str = INTERACTIVE,
+        burst_seconds: float = 1.0,
+        reserve: float = 0.5
+    ) -> None:
+        """
+        Initializes the PriorityScheduler instance.
+
+        Args:
+        - rate (float): Total requests per second.
+        - shares (dict, optional): Share of the rate per class, highest
+            priority first. Defaults to 70% interactive, 30% bulk.
+        - default (str, optional): Class of requests made without a
+            priority. Defaults to "interactive".
+        - burst_seconds (float, optional): Bucket size as seconds of
+            each class's rate. Defaults to 1.0.
+        - reserve (float, optional): Fraction of a higher-priority
+            bucket that lower classes may not borrow. Defaults to 0.5.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        shares = shares or {INTERACTIVE: 0.7, BULK: 0.3}
+        if default not in shares:
+            raise ValueError(f"default class {default!r} has no share")
+        total = sum(shares.values())
+        self.rate = rate
+        self.default = default
+        self.reserve = reserve
+        self.classes = list(shares)
+        self._rank = {name: i for i, name in enumerate(self.classes)}
+        self._rates = {
+            name: rate * share / total for name, share in shares.items()
+        }
+        self._capacity = {
+            name: max(1.0, class_rate * burst_seconds)
+            for name, class_rate in self._rates.items()
+        }
+        self._tokens = dict(self._capacity)
+        self._waiting = {name: 0 for name in self.classes}
+        self._granted = {name: 0 for name in self.classes}
+        self._waited = {name: 0.0 for name in self.classes}
+        self._updated = time.monotonic()
+        self._cond = threading.Condition()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        for name, class_rate in self._rates.items():
+            self._tokens[name] = min(
+                self._capacity[name],
+                self._tokens[name] + elapsed * class_rate
+            )
+
+    def _take(self, name: str, tokens: float) -> bool:
+        if self._tokens[name] >= tokens:
+            self._tokens[name] -= tokens
+            return True
+        rank = self._rank[name]
+        # Idle lower-priority classes first, then idle higher ones
+        # down to their reserve.
+        for other in reversed(self.classes):
+            if other == name or self._waiting[other]:
+                continue
+            floor = 0.0
+            if self._rank[other] < rank:
+                floor = self._capacity[other] * self.reserve
+            if self._tokens[other] - tokens >= floor:
+                self._tokens[other] -= tokens
+                return True
+        return False
+
+    def acquire(self, tokens: float = 1, priority: Optional[str] = None,
+                timeout: Optional[float] = None) -> float:
+        """
+        Waits until the class may send a request.
+
+        Args:
+        - tokens (float, optional): Cost of the request. Defaults to 1.
+        - priority (str, optional): Class name. Defaults to the
+            default class; unknown names get the lowest priority.
+        - timeout (float, optional): Longest wait in seconds.
+            Defaults to None (no limit).
+
+        Returns:
+        - float: Seconds spent waiting.
+
+        Raises:
+        - TimeoutError: If no tokens were granted within timeout.
+        """
+        name = priority or self.default
+        if name not in self._rates:
+            name = self.classes[-1]
+        started = time.monotonic()
+        give_up_at = started + timeout if timeout is not None else None
+        with self._cond:
+            self._refill()
+            if not self._take(name, tokens):
+                self._waiting[name] += 1
+                try:
+                    while True:
+                        missing = tokens - self._tokens[name]
+                        wait = min(
+                            self.POLL_INTERVAL, missing / self._rates[name]
+                        )
+                        if give_up_at is not None:
+                            remaining = give_up_at - time.monotonic()
+                            if remaining <= 0:
+                                raise TimeoutError(
+                                    "no tokens granted within timeout"
+                                )
+                            wait = min(wait, remaining)
+                        self._cond.wait(wait)
+                        self._refill()
+                        if self._take(name, tokens):
+                            break
+                finally:
+                    self._waiting[name] -= 1
+                    if not self._waiting[name]:
+                        self._cond.notify_all()
+            waited = time.monotonic() - started
+            self._granted[name] += 1
+            self._waited[name] += waited
+        return waited
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Returns requests granted, average wait and waiters per class.
+        """
+        with self._cond:
+            return {
+                name: {
+                    "granted": self._granted[name],
+                    "avg_wait": (
+                        self._waited[name] / self._granted[name]
+                        if self._granted[name] else 0.0
+                    ),
+                    "waiting": self._waiting[name],
+                }
+                for name in self.classes
+            }
@@ -0,0 +1,272 @@
+import struct
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Dict, Iterable, Optional
+from .utils import response_data
+"""
+Latest tickers in shared memory for many processes on one host
+
+Layout:
+    header: magic, version, slot count
+    slots:  symbol, sequence number, ts, ticker fields
+
+Each slot is a seqlock: the publisher makes the sequence number odd
+while it writes and even again afterwards; readers retry when the
+number is odd or changed during their read.
+"""
+
+MAGIC = b"BGMD"
+VERSION = 1
+FIELDS = (
+    "lastPr", "bidPr", "askPr", "bidSz", "askSz",
+    "high24h", "low24h", "baseVolume", "quoteVolume",
+)
+
+_HEADER = struct.Struct("<4sII")
+_SYMBOL = struct.Struct("<24s")
+_SEQ = struct.Struct("<Q")
+_PAYLOAD = struct.Struct("<q%dd" % len(FIELDS))
+_SEQ_OFFSET = _SYMBOL.size
+_PAYLOAD_OFFSET = _SEQ_OFFSET + _SEQ.size
+SLOT_SIZE = _PAYLOAD_OFFSET + _PAYLOAD.size
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 registers attached blocks with the resource
+        # tracker, which would unlink them when this process exits.
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class MarketDataPublisher:
+    """
+    Polls all tickers and publishes them to shared memory.
+
+    Tickers include the best bid and ask with their sizes, so one
+    get_ticker_info() call refreshes last price and top of book for
+    every symbol.
+
+    Methods:
+    - __init__(self, client, symbols, name=None, interval=1.0) -> None
+    - publish(tickers) -> int
+    - poll_once() -> int
+    - start() -> None
+    - stop() -> None
+    - close() -> None
+
+    Fields:
+    - name: Shared memory block name, passed to MarketDataReader.
+    """
+
+    def __init__(
+        self,
+        client,
+        symbols: Iterable[str],
+        name: Optional[str] = None,
+        interval: float = 1.0
+    ) -> None:
+        """
+        Initializes the MarketDataPublisher instance.
+
+        Args:
+        - client (Client): The API client.
+        - symbols (Iterable[str]): Symbols to publish (fixed layout),
+            at most 24 bytes each in UTF-8.
+        - name (str, optional): Shared memory name.
+            Defaults to a random name.
+        - interval (float, optional): Seconds between polls.
+            Defaults to 1.0.
+        """
+        self.client = client
+        self.symbols = list(symbols)
+        for symbol in self.symbols:
+            if len(symbol.encode()) > _SYMBOL.size:
+                raise ValueError(
+                    f"symbol {symbol!r} is longer than {_SYMBOL.size} bytes"
+                )
+        self.interval = interval
+        self._slots = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=True,
+            size=_HEADER.size + SLOT_SIZE * len(self.symbols)
+        )
+        self.name = self._shm.name
+        buf = self._shm.buf
+        for symbol, i in self._slots.items():
+            offset = _HEADER.size + i * SLOT_SIZE
+            _SYMBOL.pack_into(buf, offset, symbol.encode())
+            _SEQ.pack_into(buf, offset + _SEQ_OFFSET, 0)
+        _HEADER.pack_into(buf, 0, MAGIC, VERSION, len(self.symbols))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def publish(self, tickers: Iterable[dict]) -> int:
+        """
+        Writes tickers (as returned by get_ticker_info) to their slots.
+
+        Returns:
+        - int: Number of slots updated.
+        """
+        buf = self._shm.buf
+        updated = 0
+        for ticker in tickers:
+            slot = self._slots.get(ticker.get("symbol"))
+            if slot is None:
+                continue
+            offset = _HEADER.size + slot * SLOT_SIZE
+            seq = _SEQ.unpack_from(buf, offset + _SEQ_OFFSET)[0]
+            _SEQ.pack_into(buf, offset + _SEQ_OFFSET, seq + 1)
+            _PAYLOAD.pack_into(
+                buf, offset + _PAYLOAD_OFFSET,
+                int(ticker.get("ts") or 0),
+                *(float(ticker.get(field) or 0) for field in FIELDS)
+            )
+            _SEQ.pack_into(buf, offset + _SEQ_OFFSET, seq + 2)
+            updated += 1
+        return updated
+
+    def poll_once(self) -> int:
+        """
+        Fetches all tickers once and publishes them.
+
+        Returns:
+        - int: Number of slots updated.
+        """
+        return self.publish(response_data(self.client.get_ticker_info()))
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.poll_once()
+            except Exception:
+                # Readers keep the last values; retry on the next tick.
+                pass
+            self._stop.wait(
+                max(0.0, self.interval - (time.monotonic() - started))
+            )
+
+    def start(self) -> None:
+        """
+        Starts polling in a background thread.
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        """
+        Stops polling and removes the shared memory block.
+        """
+        self.stop()
+        self._shm.close()
+        self._shm.unlink()
+
+
+class MarketDataReader:
+    """
+    Lock-free reader of a MarketDataPublisher block.
+
+    Methods:
+    - __init__(self, name) -> None
+    - get(symbol) -> Optional[dict]
+    - snapshot() -> dict
+    - close() -> None
+
+    Fields:
+    - symbols: Published symbols.
+    """
+
+    # A slot that stays mid-write this long belongs to a publisher
+    # that stopped while writing it.
+    READ_TIMEOUT = 0.1
+    _SPINS = 100
+
+    def __init__(self, name: str) -> None:
+        """
+        Attaches to a published block.
+
+        Args:
+        - name (str): MarketDataPublisher.name.
+        """
+        self._shm = _attach(name)
+        buf = self._shm.buf
+        magic, version, count = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or version != VERSION:
+            self._shm.close()
+            raise ValueError(f"{name} is not a market data block")
+        self._offsets = {}
+        for i in range(count):
+            offset = _HEADER.size + i * SLOT_SIZE
+            symbol = _SYMBOL.unpack_from(buf, offset)[0].rstrip(b"\0")
+            self._offsets[symbol.decode()] = offset
+        self.symbols = list(self._offsets)
+
+    def get(self, symbol: str) -> Optional[dict]:
+        """
+        Returns a consistent copy of the latest ticker of a symbol.
+
+        Args:
+        - symbol (str): Trading pair, e.g. BTCUSDT.
+
+        Returns:
+        - dict: "ts" and the FIELDS values as floats, or None if the
+            symbol is not in the block or has not been published yet.
+
+        Raises:
+        - TimeoutError: If the slot stays mid-write for READ_TIMEOUT.
+        """
+        offset = self._offsets.get(symbol)
+        if offset is None:
+            return None
+        buf = self._shm.buf
+        seq_offset = offset + _SEQ_OFFSET
+        payload_offset = offset + _PAYLOAD_OFFSET
+        attempts = 0
+        give_up_at = None
+        while True:
+            before = _SEQ.unpack_from(buf, seq_offset)[0]
+            if not before & 1:
+                values = _PAYLOAD.unpack_from(buf, payload_offset)
+                if _SEQ.unpack_from(buf, seq_offset)[0] == before:
+                    break
+            attempts += 1
+            if attempts < self._SPINS:
+                continue
+            # The writer is slow or gone: back off instead of spinning
+            now = time.monotonic()
+            if give_up_at is None:
+                give_up_at = now + self.READ_TIMEOUT
+            elif now > give_up_at:
+                raise TimeoutError(f"slot of {symbol} is stuck mid-write")
+            time.sleep(0.001)
+        if before == 0:
+            return None
+        ticker = dict(zip(FIELDS, values[1:]))
+        ticker["ts"] = values[0]
+        return ticker
+
+    def snapshot(self) -> Dict[str, dict]:
+        """
+        Returns the latest ticker of every published symbol.
+        """
+        tickers = {}
+        for symbol in self.symbols:
+            ticker = self.get(symbol)
+            if ticker is not None:
+                tickers[symbol] = ticker
+        return tickers
+
+    def close(self) -> None:
+        self._shm.close()
@@ -0,0 +1,191 @@
+import codecs
+import json
+import re
+from typing import Any, Iterator
+from requests import Response
+from .exceptions import BitgetAPIError
+from .utils import SUCCESS_CODE
+"""
+Incremental decoding of large API responses
+"""
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_START = "-0123456789"
+# Characters that may still follow when a number is cut off at the end
+# of the buffer, e.g. "1." or "2e" or "3e-"
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*\Z")
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """
+    Text buffer over a byte-chunk iterator.
+
+    Only the unconsumed tail of the body is kept in memory,
+    so the buffer never grows much past one chunk plus one item.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """
+        Appends the next non-empty chunk to the buffer.
+
+        Returns:
+        - bool: False once the body is exhausted.
+        """
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self._append(text)
+                return True
+        self.eof = True
+        tail = self._utf8.decode(b"", final=True)
+        if tail:
+            self._append(tail)
+            return True
+        return False
+
+    def _append(self, text: str) -> None:
+        if self.pos:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        self.buf += text
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character
+        ("" at the end of the body).
+        """
+        while True:
+            buf = self.buf
+            while self.pos < len(buf) and buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(buf):
+                return buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(
+                "Expecting %r" % char, self.buf, self.pos
+            )
+        self.pos += 1
+
+    def value(self) -> Any:
+        """
+        Decodes one complete JSON value at the current position.
+        """
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # A number that reaches the buffer edge, or stops at a "."
+            # or exponent with nothing else buffered after it, may
+            # continue in the next chunk.
+            if (not self.eof and self.buf[self.pos] in _NUMBER_START
+                    and _NUMBER_TAIL.match(self.buf, end)):
+                self.fill()
+                continue
+            self.pos = end
+            return obj
+
+
+def _iter_container(reader: _Reader) -> Iterator[Any]:
+    opening = reader.peek()
+    if opening == "[":
+        closing = "]"
+    elif opening == "{":
+        closing = "}"
+    else:
+        # "data": null on error responses
+        reader.value()
+        return
+
+    reader.pos += 1
+    if reader.peek() == closing:
+        return
+    while True:
+        if closing == "]":
+            yield reader.value()
+        else:
+            key = reader.value()
+            reader.expect(":")
+            yield key, reader.value()
+        if reader.peek() == ",":
+            reader.pos += 1
+            continue
+        reader.expect(closing)
+        return
+
+
+def iter_data(response: Response, chunk_size: int = 65536) -> Iterator[Any]:
+    """
+    Yields the items of the "data" field of a response one at a time,
+    without loading or decoding the whole body.
+
+    The response should be requested with stream=True, otherwise
+    requests has already buffered the body in memory.
+    List data yields its elements, object data
+    (e.g. order book depth) yields (key, value) pairs.
+
+    Args:
+    - response (Response): A response made with stream=True.
+    - chunk_size (int, optional): Bytes read from the socket per step.
+        Defaults to 65536.
+
+    Returns:
+    - Iterator: The "data" items.
+
+    Raises:
+    - BitgetAPIError: If the HTTP status is not 200, or the "code"
+        preceding "data" is not a success code.
+    - json.JSONDecodeError: If the body is not a valid API response.
+    """
+    try:
+        if response.status_code != 200:
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = {"msg": response.text[:200]}
+            raise BitgetAPIError(
+                str(payload.get("code", response.status_code)),
+                payload.get("msg", ""), response.status_code
+            )
+        reader = _Reader(response.iter_content(chunk_size))
+        reader.expect("{")
+        code = SUCCESS_CODE
+        msg = ""
+        while reader.peek() != "}":
+            key = reader.value()
+            reader.expect(":")
+            if key == "data":
+                if code != SUCCESS_CODE:
+                    break
+                yield from _iter_container(reader)
+                return
+            value = reader.value()
+            if key == "code":
+                code = str(value)
+            elif key == "msg":
+                msg = value
+            if reader.peek() != ",":
+                reader.expect("}")
+                break
+            reader.pos += 1
+        if code != SUCCESS_CODE:
+            raise BitgetAPIError(code, msg, response.status_code)
+    finally:
+        response.close()
@@ -0,0 +1,36 @@
+from typing import Any
+from requests import Response
+from .exceptions import BitgetAPIError
+"""
+Helpers for working with API responses
+"""
+
+SUCCESS_CODE = "00000"
+
+
+def response_data(response: Response) -> Any:
+    """
+    Returns the "data" field of a successful response.
+
+    Args:
+    - response (Response): A response returned by a client method.
+
+    Returns:
+    - Any: The decoded "data" field.
+
+    Raises:
+    - BitgetAPIError: If the request failed.
+    """
+    try:
+        payload = response.json()
+    except ValueError:
+        raise BitgetAPIError(
+            str(response.status_code), response.text[:200],
+            response.status_code
+        ) from None
+    code = str(payload.get("code", response.status_code))
+    if response.status_code != 200 or code != SUCCESS_CODE:
+        raise BitgetAPIError(
+            code, payload.get("msg", ""), response.status_code
+        )
+    return payload.get("data")
@@ -0,0 +1,147 @@
+import threading
+import time
+from typing import Dict, Iterable, Optional
+from .utils import response_data
+"""
+Account valuation in USDT
+"""
+
+QUOTE = "USDT"
+BALANCE_FIELDS = ("available", "frozen", "locked")
+
+
+class PortfolioValuer:
+    """
+    Values account assets in USDT from one ticker snapshot.
+
+    All prices come from a single get_ticker_info() call, which is
+    reused for max_age seconds, so valuing many accounts costs one
+    ticker request plus one assets request per account.
+
+    Methods:
+    - __init__(self, client, max_age=5.0) -> None
+    - prices(refresh=False) -> dict
+    - value_assets(assets, prices=None) -> dict
+    - value(client=None, prices=None) -> dict
+    - value_pool(pool, uids=None) -> dict
+
+    Fields:
+    - max_age: Seconds a ticker snapshot is reused.
+    """
+
+    def __init__(self, client, max_age: float = 5.0) -> None:
+        """
+        Initializes the PortfolioValuer instance.
+
+        Args:
+        - client (Client): Client used for tickers and, by default,
+            for assets.
+        - max_age (float, optional): Seconds a ticker snapshot is
+            reused. Defaults to 5.0.
+        """
+        self.client = client
+        self.max_age = max_age
+        self._prices: Dict[str, float] = {}
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    def prices(self, refresh: bool = False) -> Dict[str, float]:
+        """
+        Returns the USDT price of every coin with a USDT market.
+
+        Args:
+        - refresh (bool, optional): Ignore the cached snapshot.
+            Defaults to False.
+
+        Returns:
+        - dict: Price per coin; USDT itself is 1.
+        """
+        with self._lock:
+            if (refresh or not self._prices
+                    or time.monotonic() - self._fetched_at > self.max_age):
+                tickers = response_data(self.client.get_ticker_info())
+                self._prices = self._build_prices(tickers)
+                self._fetched_at = time.monotonic()
+            return self._prices
+
+    @staticmethod
+    def _build_prices(tickers: Iterable[dict]) -> Dict[str, float]:
+        direct = {}
+        inverse = {}
+        for ticker in tickers:
+            symbol = ticker.get("symbol", "")
+            last = float(ticker.get("lastPr") or 0)
+            if not last:
+                continue
+            if symbol.endswith(QUOTE):
+                direct[symbol[:-len(QUOTE)]] = last
+            elif symbol.startswith(QUOTE):
+                inverse[symbol[len(QUOTE):]] = 1 / last
+        prices = dict(inverse)
+        prices.update(direct)
+        prices[QUOTE] = 1.0
+        return prices
+
+    def value_assets(self, assets: Iterable[dict],
+                     prices: Optional[Dict[str, float]] = None) -> dict:
+        """
+        Values a list of assets as returned by get_account_assets().
+
+        Args:
+        - assets (Iterable[dict]): The "data" of get_account_assets().
+        - prices (dict, optional): Price snapshot from prices().
+            Defaults to the cached snapshot.
+
+        Returns:
+        - dict: {"total": float,
+                 "coins": {coin: {"amount", "price", "value"}},
+                 "unpriced": [coins without a USDT price]}
+        """
+        if prices is None:
+            prices = self.prices()
+        coins = {}
+        unpriced = []
+        total = 0.0
+        for asset in assets:
+            coin = asset["coin"]
+            amount = sum(float(asset.get(f) or 0) for f in BALANCE_FIELDS)
+            if not amount:
+                continue
+            price = prices.get(coin)
+            if price is None:
+                unpriced.append(coin)
+                continue
+            value = amount * price
+            coins[coin] = {"amount": amount, "price": price, "value": value}
+            total += value
+        return {"total": total, "coins": coins, "unpriced": unpriced}
+
+    def value(self, client=None,
+              prices: Optional[Dict[str, float]] = None) -> dict:
+        """
+        Fetches and values the assets of one account.
+
+        Args:
+        - client (Client, optional): Account to value.
+            Defaults to self.client.
+        - prices (dict, optional): Price snapshot from prices().
+            Defaults to the cached snapshot.
+
+        Returns:
+        - dict: See value_assets().
+        """
+        client = client or self.client
+        return self.value_assets(
+            response_data(client.get_account_assets()) or [], prices
+        )
+
+    def value_pool(self, pool, uids: Optional[Iterable[str]] = None) -> dict:
+        """
+        Values every account of a ClientPool concurrently,
+        all against the same price snapshot.
+
+        Returns:
+        - dict: value_assets() result per account UID.
+        """
+        prices = self.prices()
+        return pool.map(lambda client: self.value(client, prices), uids)
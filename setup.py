@@ -5,4 +5,7 @@ setup(
     version='0.2.0',
     packages=find_packages(),
     install_requires=[],
+    extras_require={
+        "fast": ["orjson"],
+    },
 )
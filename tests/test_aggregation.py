@@ -0,0 +1,108 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from bitget_api_python.aggregation import (
+    DAY_MS, MINUTE_MS, bucket_start, resample_candles, trades_to_bars,
+)
+
+
+def ms(*args):
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def candles(start, period, count):
+    return [
+        [str(start + i * period), "1", str(2 + i), "0.5", "1.5",
+         "10", "15", "15"]
+        for i in range(count)
+    ]
+
+
+def test_bucket_start_anchors():
+    ts = ms(2024, 1, 2, 3, 30)
+    assert bucket_start(ts, "4h") == ms(2024, 1, 2, 0)
+    # 6h and longer without "utc" open at UTC+8 midnight
+    assert bucket_start(ts, "12h") == ms(2024, 1, 1, 16)
+    assert bucket_start(ts, "12Hutc") == ms(2024, 1, 2, 0)
+    assert bucket_start(ts, "1day") == ms(2024, 1, 1, 16)
+    assert bucket_start(ts, "1Dutc") == ms(2024, 1, 2, 0)
+    # Weeks open on Monday (2024-01-01)
+    assert bucket_start(ts, "1week") == ms(2023, 12, 31, 16)
+    assert bucket_start(ts, "1Wutc") == ms(2024, 1, 1, 0)
+    assert bucket_start(ms(2024, 2, 15), "1M") == ms(2024, 1, 31, 16)
+    assert bucket_start(ms(2024, 2, 15), "1Mutc") == ms(2024, 2, 1)
+    assert bucket_start(ms(2024, 1, 31, 17), "1M") == ms(2024, 1, 31, 16)
+
+
+def test_minutes_to_day_opens_at_utc8_midnight():
+    bars = resample_candles(
+        candles(ms(2024, 1, 1, 16), MINUTE_MS, 1440), "1min", "1day"
+    )
+    assert len(bars) == 1
+    assert bars[0][:5] == [ms(2024, 1, 1, 16), 1.0, 1441.0, 0.5, 1.5]
+    assert bars[0][5:] == [14400.0, 21600.0, 21600.0]
+
+    bars = resample_candles(
+        candles(ms(2024, 1, 1, 16), MINUTE_MS, 1440), "1min", "1Dutc"
+    )
+    assert [bar[0] for bar in bars] == [ms(2024, 1, 1), ms(2024, 1, 2)]
+
+
+def test_days_to_week_opens_on_monday_utc8():
+    daily = candles(ms(2023, 12, 31, 16), DAY_MS, 8)
+    bars = resample_candles(daily, "1day", "1week")
+    assert [bar[0] for bar in bars] == [
+        ms(2023, 12, 31, 16), ms(2024, 1, 7, 16)
+    ]
+    bars = resample_candles(daily, "1day", "1week", complete_only=True)
+    assert [bar[0] for bar in bars] == [ms(2023, 12, 31, 16)]
+
+
+def test_days_to_month():
+    # February 2024 has 29 days
+    daily = candles(ms(2024, 1, 31, 16), DAY_MS, 29)
+    bars = resample_candles(daily, "1day", "1M", complete_only=True)
+    assert [bar[0] for bar in bars] == [ms(2024, 1, 31, 16)]
+    assert resample_candles(
+        daily[:-1], "1day", "1M", complete_only=True
+    ) == []
+
+
+def test_complete_only_drops_partial_and_gapped_bars():
+    minutes = candles(ms(2024, 1, 1, 0, 30), MINUTE_MS, 150)
+    del minutes[100]
+    bars = resample_candles(minutes, "1min", "1h")
+    assert [bar[0] for bar in bars] == [
+        ms(2024, 1, 1, 0), ms(2024, 1, 1, 1), ms(2024, 1, 1, 2)
+    ]
+    # 00:00 misses its first half, 02:00 one minute; 01:00 is whole
+    bars = resample_candles(minutes, "1min", "1h", complete_only=True)
+    assert [bar[0] for bar in bars] == [ms(2024, 1, 1, 1)]
+
+
+def test_resample_rejects_misaligned_targets():
+    with pytest.raises(ValueError):
+        resample_candles([], "1week", "1M")
+    with pytest.raises(ValueError):
+        resample_candles([], "1M", "1Mutc")
+    with pytest.raises(ValueError):
+        resample_candles([], "1day", "1Wutc")
+
+
+def test_trades_to_bars_splits_at_utc8_midnight():
+    boundary = ms(2024, 1, 1, 16)
+    trades = [
+        {"tradeId": "3", "ts": str(boundary), "price": "12", "size": "1"},
+        {"tradeId": "1", "ts": str(boundary - 1), "price": "10",
+         "size": "1"},
+        {"tradeId": "2", "ts": str(boundary - 1), "price": "11",
+         "size": "3"},
+        {"tradeId": "4", "ts": str(boundary + 5), "price": "9",
+         "size": "1"},
+    ]
+    bars = trades_to_bars(trades, "1day")
+    assert bars == [
+        [boundary - DAY_MS, 10.0, 11.0, 10.0, 11.0, 4.0, 43.0, 10.75, 2],
+        [boundary, 12.0, 12.0, 9.0, 9.0, 2.0, 21.0, 10.5, 2],
+    ]
@@ -0,0 +1,132 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bitget_api_python import Client, ResponseCache
+from bitget_api_python.aggregation import HOUR_MS, MINUTE_MS
+from bitget_api_python.cache import (
+    CANDLES, HISTORY_CANDLES, MARKET_TRADES, MONTH_MS,
+)
+
+NOW = 1700000000000
+SETTLE = 60 * 1000
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path), settle_ms=SETTLE)
+
+
+@pytest.mark.parametrize("endpoint", [HISTORY_CANDLES, CANDLES])
+def test_candles_need_a_closed_last_bar(cache, endpoint):
+    def immutable(end_time, granularity="1h", now=NOW):
+        params = {"symbol": "BTCUSDT", "granularity": granularity,
+                  "endTime": str(end_time)}
+        return cache.is_immutable(endpoint, params, now)
+
+    settled = NOW - HOUR_MS - SETTLE
+    assert immutable(settled)
+    assert not immutable(settled + 1)
+    assert immutable(NOW - MINUTE_MS - SETTLE, "1min")
+    # Monthly bars are assumed to last 31 days
+    assert immutable(NOW - MONTH_MS - SETTLE, "1M")
+    assert not immutable(NOW - 30 * 24 * HOUR_MS - SETTLE, "1M")
+    assert not cache.is_immutable(
+        endpoint, {"symbol": "BTCUSDT", "granularity": "1h"}, NOW
+    )
+
+
+def test_trades_need_a_past_end_or_id_bound(cache):
+    def immutable(**params):
+        return cache.is_immutable(MARKET_TRADES, params, NOW)
+
+    assert immutable(endTime=str(NOW - SETTLE))
+    assert not immutable(endTime=str(NOW - SETTLE + 1))
+    assert immutable(idLessThan="123")
+    assert not immutable(endTime=str(NOW), idLessThan="123")
+    assert not immutable(symbol="BTCUSDT")
+
+
+def test_other_endpoints_are_never_immutable(cache):
+    params = {"endTime": "1", "idLessThan": "1"}
+    assert not cache.is_immutable("/api/v2/spot/market/tickers", params)
+    assert not cache.is_immutable("/api/v2/spot/trade/fills", params)
+
+
+class CandleHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self.server.requests += 1
+        status, body = self.server.reply
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CandleHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server, cache):
+    server.requests = 0
+    server.reply = (200, b'{"code":"00000","msg":"success","data":[]}')
+    client = Client("key", "secret", "passphrase", check_connection=False,
+                    response_cache=cache)
+    client.HOST = f"http://127.0.0.1:{server.server_address[1]}"
+    return client
+
+
+def candle_params(end_time):
+    return {"symbol": "BTCUSDT", "granularity": "1h",
+            "endTime": str(end_time)}
+
+
+def now_ms():
+    return int(time.time() * 1000)
+
+
+def test_closed_candles_are_served_from_cache(client, server, cache):
+    params = candle_params(now_ms() - 2 * HOUR_MS)
+    first = client.get(HISTORY_CANDLES, params)
+    second = client.get(HISTORY_CANDLES, params)
+    assert server.requests == 1
+    assert second.content == first.content
+    assert second.json()["code"] == "00000"
+    assert cache.hits == 1
+
+
+def test_open_candle_window_is_not_cached(client, server, cache):
+    params = candle_params(now_ms() - HOUR_MS // 2)
+    client.get(HISTORY_CANDLES, params)
+    client.get(HISTORY_CANDLES, params)
+    assert server.requests == 2
+    assert cache.size == 0
+
+
+@pytest.mark.parametrize("reply", [
+    (200, b'{"code":"40001","msg":"00000","data":null}'),
+    (200, b'{"code":"429","msg":"too many requests"}'),
+    (500, b'{"code":"00000","msg":"success","data":[]}'),
+])
+def test_error_responses_are_never_stored(client, server, cache, reply):
+    server.reply = reply
+    params = candle_params(now_ms() - 2 * HOUR_MS)
+    client.get(HISTORY_CANDLES, params)
+    client.get(HISTORY_CANDLES, params)
+    assert server.requests == 2
+    assert cache.size == 0
@@ -0,0 +1,132 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bitget_api_python import (
+    CircuitBreakers, CircuitOpenError, Client, DeadlineExceeded,
+    RateLimiter,
+)
+
+BODY = json.dumps({"code": "00000", "msg": "success", "data": []}).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    delay = 0.0
+    status = 200
+
+    def do_GET(self) -> None:
+        time.sleep(self.delay)
+        self.send_response(self.status)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    Handler.delay = 0.0
+    Handler.status = 200
+
+
+def make_client(server, breakers, **kwargs):
+    client = Client("key", "secret", "passphrase", check_connection=False,
+                    circuit_breakers=breakers, **kwargs)
+    client.HOST = f"http://127.0.0.1:{server.server_address[1]}"
+    return client
+
+
+def test_opens_on_errors_and_recovers_through_probe(server):
+    breakers = CircuitBreakers(min_requests=4, window=4, open_seconds=0.2)
+    client = make_client(server, breakers)
+    Handler.status = 503
+    for _ in range(4):
+        client.get("/api/v2/public/time")
+    with pytest.raises(CircuitOpenError):
+        client.get("/api/v2/public/time")
+    # Other endpoints are unaffected
+    assert client.get("/api/v2/spot/public/coins").status_code == 503
+    Handler.status = 200
+    time.sleep(0.25)
+    assert client.get("/api/v2/public/time").status_code == 200
+    assert breakers.state("/api/v2/public/time") == "closed"
+    row = client.metrics.snapshot()["/api/v2/public/time"]
+    assert row["circuit"] == "closed" and row["rejected"] == 1
+
+
+def test_unsent_and_deadline_cut_requests_do_not_trip(server):
+    breakers = CircuitBreakers(min_requests=2, window=10)
+    client = make_client(
+        server, breakers, rate_limiter=RateLimiter(5, capacity=1),
+        deadline=0.3
+    )
+
+    def call(_):
+        try:
+            client.get("/api/v2/public/time")
+        except DeadlineExceeded:
+            return "deadline"
+        return "ok"
+
+    with ThreadPoolExecutor(10) as executor:
+        outcomes = list(executor.map(call, range(10)))
+    assert "deadline" in outcomes
+    assert breakers.state("/api/v2/public/time") == "closed"
+    assert client.get("/api/v2/public/time", deadline=1).status_code == 200
+
+
+class SlowLimiter:
+    """
+    Limiter that ignores timeout and always waits past the deadline.
+    """
+
+    def acquire(self, tokens=1, priority=None, timeout=None) -> float:
+        time.sleep(0.06)
+        return 0.06
+
+
+def test_deadline_passed_before_sending_is_neutral(server):
+    breakers = CircuitBreakers(min_requests=2, window=2, open_seconds=60)
+    client = make_client(server, breakers, rate_limiter=SlowLimiter())
+    for _ in range(3):
+        with pytest.raises(DeadlineExceeded):
+            client.get("/api/v2/public/time", deadline=0.05)
+    assert breakers.state("/api/v2/public/time") == "closed"
+    assert client.get("/api/v2/public/time").status_code == 200
+
+
+def test_slow_requests_trip_even_when_cut_by_deadline():
+    breakers = CircuitBreakers(min_requests=2, window=2, slow_seconds=0.1)
+    breakers.before("/e")
+    assert breakers.after("/e", 0.05, failed=None) == "closed"
+    for _ in range(2):
+        breakers.before("/e")
+        breakers.after("/e", 0.2, failed=None)
+    assert breakers.state("/e") == "open"
+
+
+def test_release_frees_half_open_probe():
+    breakers = CircuitBreakers(min_requests=1, window=1, open_seconds=0.01)
+    breakers.before("/e")
+    breakers.after("/e", 0.0, failed=True)
+    time.sleep(0.02)
+    assert breakers.before("/e") == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breakers.before("/e")
+    breakers.release("/e")
+    assert breakers.before("/e") == "half_open"
+    assert breakers.after("/e", 0.0) == "closed"
@@ -0,0 +1,102 @@
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from bitget_api_python import (
+    Client, DeadlineExceeded, PriorityScheduler, RateLimiter,
+)
+from bitget_api_python.bitget_auth import _Watchdog
+
+
+class DripHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b'{"code":"00000","data":"' + b"x" * 100 + b'"}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            for i in range(len(body)):
+                self.wfile.write(body[i:i + 1])
+                self.wfile.flush()
+                time.sleep(0.05)
+        except OSError:
+            pass
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def client():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DripHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = Client("key", "secret", "passphrase", check_connection=False)
+    client.HOST = f"http://127.0.0.1:{server.server_address[1]}"
+    yield client
+    server.shutdown()
+    server.server_close()
+
+
+def test_deadline_bounds_trickling_body(client):
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        client.get("/api/v2/public/time", deadline=0.5)
+    assert time.monotonic() - started < 1.0
+    assert client.metrics.snapshot()["/api/v2/public/time"]["timeouts"] == 1
+
+
+@pytest.mark.parametrize("limiter", [
+    RateLimiter(1, capacity=1), PriorityScheduler(1, burst_seconds=1),
+])
+def test_deadline_bounds_rate_limiter_wait(client, limiter):
+    # Drain every bucket (the scheduler lends idle classes' tokens)
+    with pytest.raises(TimeoutError):
+        while True:
+            limiter.acquire(timeout=0)
+    client.rate_limiter = limiter
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceeded, match="rate limiter"):
+        client.get("/api/v2/public/time", deadline=0.2)
+    assert time.monotonic() - started < 0.5
+
+
+def test_rate_limiter_timeout_takes_no_tokens():
+    limiter = RateLimiter(1, capacity=1)
+    limiter.acquire()
+    with pytest.raises(TimeoutError):
+        limiter.acquire(timeout=0.1)
+    time.sleep(1.0)
+    assert limiter.acquire(timeout=0.1) < 0.1
+
+
+def fake_response(sock):
+    return SimpleNamespace(raw=SimpleNamespace(
+        _connection=SimpleNamespace(sock=sock)
+    ))
+
+
+def test_watchdog_shuts_down_due_sockets_only():
+    watchdog = _Watchdog()
+    before_threads = threading.active_count()
+    due, spared = socket.socketpair(), socket.socketpair()
+    try:
+        now = time.monotonic()
+        watchdog.add(now + 0.1, fake_response(due[0]))
+        entry = watchdog.add(now + 0.05, fake_response(spared[0]))
+        watchdog.remove(entry)
+        # Returns at the deadline instead of blocking forever
+        assert due[0].recv(1) == b""
+        assert time.monotonic() - now < 1.0
+        spared[1].sendall(b"x")
+        assert spared[0].recv(1) == b"x"
+        assert threading.active_count() <= before_threads + 1
+    finally:
+        for sock in due + spared:
+            sock.close()
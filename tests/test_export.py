@@ -0,0 +1,77 @@
+import csv
+import os
+
+from bitget_api_python import BillsExporter
+from bitget_api_python.rate_limit import RateLimiter
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, data) -> None:
+        self.data = data
+
+    def json(self):
+        return {"code": "00000", "msg": "success", "data": self.data}
+
+
+class BillsClient:
+    """
+    Serves bills like Bitget: both time bounds inclusive, newest
+    first, paged with idLessThan.
+    """
+
+    rate_limiter = None
+
+    def __init__(self, times) -> None:
+        self.bills = [
+            {"billId": str(i + 1), "cTime": str(t), "coin": "USDT"}
+            for i, t in enumerate(sorted(times))
+        ]
+
+    def get_account_bills(self, coin=None, business_type=None,
+                          start_time=None, end_time=None, limit=100,
+                          id_less_than=None):
+        page = [
+            bill for bill in reversed(self.bills)
+            if int(start_time) <= int(bill["cTime"]) <= int(end_time)
+            and (id_less_than is None
+                 or int(bill["billId"]) < int(id_less_than))
+        ]
+        return FakeResponse(page[:limit])
+
+
+def exported_ids(out_dir):
+    with open(os.path.join(out_dir, "bills_USDT_all.csv")) as f:
+        return sorted(int(row["billId"]) for row in csv.DictReader(f))
+
+
+def export(client, out_dir, start_time, end_time):
+    exporter = BillsExporter(
+        client, str(out_dir), ["USDT"], start_time, end_time,
+        window_ms=100, max_workers=1, rate_limiter=RateLimiter(10000),
+    )
+    exporter.PAGE_LIMIT = 3
+    return exporter.run()["USDT:all"]
+
+
+def test_rerun_with_later_end_exports_the_rest(tmp_path):
+    client = BillsClient(range(1005, 1500, 10))
+    assert export(client, tmp_path, 1000, 1250) == 25
+    assert export(client, tmp_path, 1000, 1250) == 0
+    assert export(client, tmp_path, 1000, 1500) == 25
+    assert exported_ids(tmp_path) == list(range(1, 51))
+
+
+def test_rerun_with_earlier_start_exports_the_head(tmp_path):
+    client = BillsClient(range(1005, 1500, 10))
+    assert export(client, tmp_path, 1200, 1500) == 30
+    assert export(client, tmp_path, 1000, 1500) == 20
+    assert exported_ids(tmp_path) == list(range(1, 51))
+
+
+def test_bill_on_a_window_boundary_is_written_once(tmp_path):
+    client = BillsClient(range(1000, 1500, 10))
+    assert export(client, tmp_path, 1000, 1250) == 25
+    assert export(client, tmp_path, 1000, 1500) == 25
+    assert exported_ids(tmp_path) == list(range(1, 51))
@@ -0,0 +1,28 @@
+from bitget_api_python.metrics import RequestMetrics
+
+
+def test_percentile_refreshes_after_new_samples():
+    metrics = RequestMetrics(window=100, refresh=10)
+    assert metrics.percentile("/e", 50) is None
+    for _ in range(5):
+        metrics.observe("/e", 1.0)
+    assert metrics.percentile("/e", 50, min_samples=10) is None
+    for _ in range(5):
+        metrics.observe("/e", 1.0)
+    assert metrics.percentile("/e", 50, min_samples=10) == 1.0
+
+    for _ in range(9):
+        metrics.observe("/e", 2.0)
+    # Cached until `refresh` new samples arrive
+    assert metrics.percentile("/e", 99) == 1.0
+    metrics.observe("/e", 2.0)
+    assert metrics.percentile("/e", 99) == 2.0
+
+
+def test_errors_and_timeouts_are_not_latency_samples():
+    metrics = RequestMetrics()
+    metrics.observe("/e", 5.0, error=True)
+    metrics.observe("/e", 5.0, timeout=True)
+    assert metrics.percentile("/e", 50) is None
+    row = metrics.snapshot()["/e"]
+    assert (row["requests"], row["errors"], row["timeouts"]) == (2, 1, 1)
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from bitget_api_python import QuantizerTable
+
+
+def table(price_precision: int, quantity_precision: int) -> QuantizerTable:
+    return QuantizerTable([{
+        "symbol": "TESTUSDT",
+        "pricePrecision": str(price_precision),
+        "quantityPrecision": str(quantity_precision),
+        "minTradeAmount": "0",
+        "maxTradeAmount": "0",
+        "minTradeUSDT": "0",
+        "quoteCoin": "USDT",
+        "status": "online",
+    }])
+
+
+def on_grid(rng: random.Random, precision: int, digits: int) -> str:
+    ticks = rng.randrange(1, 10 ** digits)
+    if precision == 0:
+        return str(ticks)
+    text = str(ticks).rjust(precision + 1, "0")
+    return f"{text[:-precision]}.{text[-precision:]}"
+
+
+@pytest.mark.parametrize("precision", range(0, 9))
+def test_quantized_values_round_trip(precision):
+    rng = random.Random(precision)
+    quantizer = table(precision, precision)
+    symbols = ["TESTUSDT"] * 5000
+    # Strings are exact at any length; floats up to 13 digits
+    values = [on_grid(rng, precision, rng.randint(1, 18))
+              for _ in symbols]
+    prices, sizes, _ = quantizer.quantize_batch(symbols, values, values)
+    assert prices == values
+    assert sizes == values
+    values = [on_grid(rng, precision, rng.randint(1, 13))
+              for _ in symbols]
+    floats = [float(value) for value in values]
+    prices, sizes, _ = quantizer.quantize_batch(symbols, floats, floats)
+    assert prices == values
+    assert sizes == values
+
+
+@pytest.mark.parametrize("price, size, expected", [
+    ("677176.396", "677176.396", ("677176.3960", "677176.3960")),
+    (677176.396, 677176.396, ("677176.3960", "677176.3960")),
+    (0.29, 0.29, ("0.2900", "0.2900")),
+])
+def test_known_float_traps(price, size, expected):
+    assert table(4, 4).quantize("TESTUSDT", price, size)[:2] == expected
+
+
+def test_precision_eight():
+    quantizer = table(8, 8)
+    assert quantizer.quantize("TESTUSDT", 83.13508755, 83.13508755)[:2] == (
+        "83.13508755", "83.13508755"
+    )
+
+
+@pytest.mark.parametrize("price", ["1.005", 1.005])
+def test_price_halves_round_up(price):
+    assert table(2, 2).quantize("TESTUSDT", price, "1")[0] == "1.01"
+
+
+def test_size_rounds_down():
+    assert table(2, 2).quantize("TESTUSDT", "1", "1.019")[1] == "1.01"
+    assert table(2, 2).quantize("TESTUSDT", "1", 1.019)[1] == "1.01"
+
+
+def test_invalid_string_raises_value_error():
+    with pytest.raises(ValueError):
+        table(2, 2).quantize("TESTUSDT", "abc", "1")
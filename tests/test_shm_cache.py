@@ -0,0 +1,42 @@
+import pytest
+
+from bitget_api_python.shm_cache import (
+    _SEQ, _SEQ_OFFSET, MarketDataPublisher, MarketDataReader,
+)
+
+
+@pytest.fixture
+def publisher():
+    publisher = MarketDataPublisher(None, ["BTCUSDT", "ETHUSDT"])
+    yield publisher
+    publisher.close()
+
+
+def test_get_returns_published_ticker(publisher):
+    publisher.publish([{"symbol": "BTCUSDT", "ts": "5", "lastPr": "1.5"}])
+    reader = MarketDataReader(publisher.name)
+    try:
+        ticker = reader.get("BTCUSDT")
+        assert ticker["ts"] == 5 and ticker["lastPr"] == 1.5
+        assert reader.get("ETHUSDT") is None
+        assert reader.get("XRPUSDT") is None
+        assert list(reader.snapshot()) == ["BTCUSDT"]
+    finally:
+        reader.close()
+
+
+def test_get_gives_up_on_slot_stuck_mid_write(publisher):
+    reader = MarketDataReader(publisher.name)
+    try:
+        # Odd sequence number: a publisher died while writing
+        offset = reader._offsets["BTCUSDT"] + _SEQ_OFFSET
+        _SEQ.pack_into(publisher._shm.buf, offset, 3)
+        with pytest.raises(TimeoutError):
+            reader.get("BTCUSDT")
+    finally:
+        reader.close()
+
+
+def test_publisher_rejects_long_symbols():
+    with pytest.raises(ValueError):
+        MarketDataPublisher(None, ["X" * 25])
@@ -0,0 +1,76 @@
+import base64
+import hashlib
+import hmac
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bitget_api_python import Client, bitget_auth
+
+
+class CaptureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.captured.append(
+            (self.path, dict(self.headers), self.rfile.read(length))
+        )
+        body = b'{"code":"00000","msg":"success","data":null}'
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CaptureHandler)
+    server.daemon_threads = True
+    server.captured = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=["orjson", "json"])
+def serializer(request, monkeypatch):
+    if request.param == "orjson":
+        if bitget_auth.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(bitget_auth, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("body", [
+    {"symbol": "BTCUSDT", "price": "1.5", "clientOid": "café-1"},
+    [{"orderId": "1"}, {"orderId": "2"}],
+    '{"symbol": "BTCUSDT", "note": "naïve"}',
+    b'{"symbol":"BTCUSDT"}',
+])
+def test_signature_covers_the_bytes_sent(server, serializer, body):
+    client = Client("key", "secret", "passphrase", check_connection=False)
+    client.HOST = f"http://127.0.0.1:{server.server_address[1]}"
+    endpoint = "/api/v2/spot/trade/place-order"
+    client.post(endpoint, params={"a": "1"}, body=body)
+
+    path, headers, sent = server.captured[-1]
+    assert path == endpoint + "?a=1"
+    assert sent == bitget_auth.serialize_body(body)
+    timestamp = headers["ACCESS-TIMESTAMP"]
+    expected = client.sign(
+        int(timestamp), "POST", endpoint, {"a": "1"}, sent
+    )
+    assert headers["ACCESS-SIGN"] == expected.decode()
+    mac = hmac.new(
+        b"secret", timestamp.encode() + b"POST" + path.encode() + sent,
+        hashlib.sha256
+    )
+    assert headers["ACCESS-SIGN"] == base64.b64encode(mac.digest()).decode()
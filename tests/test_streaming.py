@@ -0,0 +1,111 @@
+import json
+import random
+
+import pytest
+
+from bitget_api_python import BitgetAPIError, iter_data
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, status_code: int = 200,
+                 chunk_sizes=None) -> None:
+        self.body = body
+        self.status_code = status_code
+        self.chunk_sizes = chunk_sizes
+        self.closed = False
+
+    @property
+    def text(self) -> str:
+        return self.body.decode()
+
+    def json(self):
+        return json.loads(self.body)
+
+    def iter_content(self, chunk_size):
+        pos = 0
+        while pos < len(self.body):
+            size = self.chunk_sizes() if self.chunk_sizes else chunk_size
+            yield self.body[pos:pos + size]
+            pos += size
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def envelope(data, code="00000", msg="success") -> bytes:
+    return json.dumps({
+        "code": code, "msg": msg, "requestTime": 1, "data": data
+    }, ensure_ascii=False).encode()
+
+
+NUMBERS = [1.5, -500.0, 0, -0.25, 1e-07, 2.5e+20, -3e-05, 123456789,
+           "12.50", 0.1]
+ITEMS = [
+    {"symbol": "BTCUSDT", "price": 65000.25, "size": -1.5e-3},
+    {"note": "ünïcödé €", "values": [1.0, 2e10, -3.25]},
+    ["nested", [True, False, None]],
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 5, 7, 16, 65536])
+def test_list_items_across_chunk_sizes(chunk_size):
+    data = NUMBERS + ITEMS
+    response = FakeResponse(envelope(data))
+    assert list(iter_data(response, chunk_size)) == data
+    assert response.closed
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random_chunk_boundaries(seed):
+    rng = random.Random(seed)
+    data = [rng.choice(NUMBERS + ITEMS) for _ in range(20)]
+    response = FakeResponse(
+        envelope(data), chunk_sizes=lambda: rng.randint(1, 6)
+    )
+    assert list(iter_data(response)) == data
+
+
+def test_serialized_float_split_at_every_offset():
+    body = b'{"code":"00000","data":[-500.0,1.5,2e-3]}'
+    for split in range(1, len(body)):
+        sizes = iter([split, len(body)])
+        response = FakeResponse(body, chunk_sizes=lambda: next(sizes))
+        assert list(iter_data(response)) == [-500.0, 1.5, 2e-3]
+
+
+def test_object_data_yields_pairs():
+    data = {"asks": [["1.5", "2"]], "bids": [["1.4", "3"]], "ts": 5}
+    assert list(iter_data(FakeResponse(envelope(data)), 3)) == list(
+        data.items()
+    )
+
+
+def test_null_data_with_success_code_is_empty():
+    assert list(iter_data(FakeResponse(envelope(None)))) == []
+
+
+def test_error_code_before_data_raises():
+    response = FakeResponse(envelope(None, code="40034", msg="bad symbol"))
+    with pytest.raises(BitgetAPIError) as excinfo:
+        list(iter_data(response, 4))
+    assert excinfo.value.code == "40034"
+    assert excinfo.value.msg == "bad symbol"
+    assert response.closed
+
+
+@pytest.mark.parametrize("status_code", [429, 500, 503])
+def test_http_error_raises(status_code):
+    response = FakeResponse(
+        envelope(None, code="429", msg="Too Many Requests"), status_code
+    )
+    with pytest.raises(BitgetAPIError) as excinfo:
+        list(iter_data(response))
+    assert excinfo.value.status_code == status_code
+    assert response.closed
+
+
+def test_http_error_without_json_body_raises():
+    response = FakeResponse(b"<html>Bad Gateway</html>", 502)
+    with pytest.raises(BitgetAPIError) as excinfo:
+        list(iter_data(response))
+    assert excinfo.value.code == "502"
@@ -0,0 +1,87 @@
+from bitget_api_python.tape import TradeTape
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, data) -> None:
+        self.data = data
+
+    def json(self):
+        return {"code": "00000", "msg": "success", "data": self.data}
+
+
+class TradesClient:
+    """
+    Serves market trades newest first, paged with idLessThan. Trades
+    older than `history_from` are never returned, like a server whose
+    history ends: the crawl then gets a short page early.
+    """
+
+    def __init__(self, times, history_from=None) -> None:
+        self.trades = [
+            {"tradeId": str(i + 1), "ts": str(t)}
+            for i, t in enumerate(sorted(times))
+        ]
+        self.history_from = history_from
+
+    def get_market_trades(self, symbol, limit="500", idLessThan=None,
+                          startTime=None, endTime=None):
+        page = [
+            trade for trade in reversed(self.trades)
+            if int(startTime) <= int(trade["ts"]) <= int(endTime)
+            and (idLessThan is None
+                 or int(trade["tradeId"]) < int(idLessThan))
+            and (self.history_from is None
+                 or int(trade["ts"]) >= self.history_from)
+        ]
+        return FakeResponse(page[:int(limit)])
+
+
+def make_tape(client, **kwargs):
+    tape = TradeTape(client, "BTCUSDT", window_ms=1000, max_workers=2,
+                     max_silence_ms=100, **kwargs)
+    tape.PAGE_LIMIT = 5
+    return tape
+
+
+def test_complete_tape_has_no_gaps():
+    client = TradesClient(range(0, 3000, 10))
+    tape = make_tape(client)
+    trades = list(tape.iter_trades(0, 3000))
+    assert [int(t["tradeId"]) for t in trades] == list(range(1, 301))
+    assert tape.gaps == []
+
+
+def test_short_page_before_window_start_is_a_gap():
+    client = TradesClient(range(0, 2000, 10), history_from=1500)
+    tape = make_tape(client)
+    trades = list(tape.iter_trades(1000, 2000))
+    assert len(trades) == 50
+    assert tape.gaps == [(1000, 1500, "history ended after 11 pages")]
+
+
+def test_single_short_page_is_not_a_gap():
+    # A quiet window: the first page is already short
+    client = TradesClient([1500, 1600])
+    tape = make_tape(client)
+    assert len(list(tape.iter_trades(1000, 2000))) == 2
+    assert tape.gaps == []
+
+
+def test_empty_window_between_busy_ones_is_a_gap():
+    client = TradesClient(
+        list(range(0, 1000, 100)) + list(range(3000, 4000, 100))
+    )
+    tape = make_tape(client)
+    assert len(list(tape.iter_trades(0, 5000))) == 20
+    assert tape.gaps == [
+        (1000, 3000, "no trades between non-empty windows")
+    ]
+
+
+def test_stopped_crawl_is_a_gap():
+    client = TradesClient(range(0, 1000, 10))
+    tape = make_tape(client, max_pages=4)
+    assert len(list(tape.iter_trades(0, 1000))) == 20
+    assert tape.gaps == [(0, 1000, "stopped after 4 pages")]
@@ -0,0 +1,99 @@
+import json
+
+from requests.exceptions import ReadTimeout
+
+from bitget_api_python import BitgetAPIError
+from bitget_api_python.mixins import TradeMixin
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, data) -> None:
+        self.data = data
+
+    def json(self):
+        return {"code": "00000", "msg": "success", "data": self.data}
+
+
+class StubClient(TradeMixin):
+    """
+    Answers batch requests like Bitget: every result carries both
+    orderId and clientOid, whichever the order was submitted with.
+    """
+
+    def __init__(self, fail=()) -> None:
+        self.fail = set(fail)
+        self.requests = []
+
+    def post(self, endpoint, params=None, body=None):
+        self.requests.append((endpoint, json.loads(json.dumps(body))))
+        success, failure = [], []
+        for i, order in enumerate(body["orderList"]):
+            item = {
+                "orderId": order.get("orderId") or f"id-{order['clientOid']}",
+                "clientOid": order.get("clientOid") or f"server-{i}",
+            }
+            if item["orderId"] in self.fail:
+                failure.append(dict(item, errorMsg="order not found"))
+            else:
+                success.append(item)
+        return FakeResponse({"successList": success, "failureList": failure})
+
+
+def test_cancel_by_order_id_matches_results():
+    client = StubClient(fail={"3"})
+    orders = [{"orderId": str(i)} for i in range(120)]
+    results = client.cancel_orders("BTCUSDT", orders)
+    assert list(results) == [str(i) for i in range(120)]
+    assert [r["success"] for r in results.values()].count(False) == 1
+    assert results["3"]["errorMsg"] == "order not found"
+    assert len(client.requests) == 3
+
+
+def test_cancel_by_client_oid_matches_results():
+    client = StubClient()
+    orders = [{"clientOid": "a"}, {"orderId": "42"}]
+    results = client.cancel_orders("BTCUSDT", orders)
+    assert results["a"]["success"] and results["42"]["success"]
+
+
+def test_place_orders_generates_client_oids():
+    client = StubClient()
+    orders = [{"side": "buy", "orderType": "limit", "price": "1",
+               "size": "1"} for _ in range(3)]
+    results = client.place_orders("BTCUSDT", orders)
+    assert len(results) == 3
+    assert all(r["success"] for r in results.values())
+    assert all(r["clientOid"] == oid for oid, r in results.items())
+
+
+class FailingClient(TradeMixin):
+    def __init__(self, exc) -> None:
+        self.exc = exc
+
+    def post(self, endpoint, params=None, body=None):
+        raise self.exc
+
+
+def test_transport_error_reports_unknown_outcome():
+    exc = ReadTimeout("read timed out")
+    results = FailingClient(exc).place_orders(
+        "BTCUSDT", [{"clientOid": "a"}, {"clientOid": "b"}]
+    )
+    assert [r["success"] for r in results.values()] == [None, None]
+    assert results["a"]["error"] is exc
+
+
+def test_server_error_reports_unknown_outcome():
+    results = FailingClient(BitgetAPIError("502", "", 502)).cancel_orders(
+        "BTCUSDT", [{"orderId": "1"}]
+    )
+    assert results["1"]["success"] is None
+
+
+def test_rejected_batch_reports_failure():
+    exc = BitgetAPIError("40034", "bad params", 400)
+    results = FailingClient(exc).place_orders("BTCUSDT", [{"clientOid": "a"}])
+    assert results["a"]["success"] is False
+    assert "bad params" in results["a"]["errorMsg"]
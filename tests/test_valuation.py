@@ -0,0 +1,54 @@
+from bitget_api_python import PortfolioValuer
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, data) -> None:
+        self.data = data
+
+    def json(self):
+        return {"code": "00000", "msg": "success", "data": self.data}
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.ticker_calls = 0
+
+    def get_ticker_info(self):
+        self.ticker_calls += 1
+        price = str(100 * self.ticker_calls)
+        return FakeResponse([{"symbol": "BTCUSDT", "lastPr": price}])
+
+    def get_account_assets(self):
+        return FakeResponse([
+            {"coin": "BTC", "available": "1", "frozen": "0"},
+            {"coin": "USDT", "available": "5"},
+        ])
+
+
+class FakePool:
+    def __init__(self, clients) -> None:
+        self.clients = clients
+
+    def map(self, func, uids=None):
+        return {uid: func(client) for uid, client in self.clients.items()}
+
+
+def test_value_assets():
+    valuer = PortfolioValuer(FakeClient())
+    result = valuer.value()
+    assert result["total"] == 105.0
+    assert result["coins"]["BTC"] == {
+        "amount": 1.0, "price": 100.0, "value": 100.0
+    }
+
+
+def test_value_pool_uses_one_snapshot():
+    client = FakeClient()
+    # Every prices() call would refetch
+    valuer = PortfolioValuer(client, max_age=-1)
+    pool = FakePool({str(uid): FakeClient() for uid in range(5)})
+    results = valuer.value_pool(pool)
+    assert client.ticker_calls == 1
+    assert {r["coins"]["BTC"]["price"] for r in results.values()} == {100.0}